@@ -1,5 +1,10 @@
 # V
 
+import numpy as np
+
+from numeros_duais import Dual
+from telemetria import Telemetria
+
 def eliminacao_gauss(A, b):
     # A: matriz dos coeficientes
     # b: vetor dos termos independentes
@@ -40,9 +45,130 @@ def eliminacao_gauss(A, b):
 
     return x 
 
+def norma(v):
+    return sum(vi**2 for vi in v) ** 0.5
+
+def jacobiana_diferencas(F, x, Fx=None, vetorizada=False):
+    # Jacobiana por diferenças progressivas, passo h_j = √ε·max(|x_j|, 1).
+    # Com vetorizada=True, F recebe uma matriz n x n cuja coluna j é x + h_j e_j e devolve
+    # as n avaliações de uma vez (F escrita com operações que valem coluna a coluna); se F
+    # não aceitar a matriz ou devolver outra forma, avalia coluna a coluna.
+    x = np.asarray(x, dtype=float)
+    n = len(x)
+    Fx = np.asarray(F(x) if Fx is None else Fx, dtype=float)
+    h = np.sqrt(np.finfo(float).eps) * np.maximum(np.abs(x), 1.0)
+    X = x[:, None] + np.diag(h)
+
+    FX = None
+    if vetorizada:
+        try:
+            FX = np.asarray(F(X), dtype=float)
+        except (TypeError, ValueError, IndexError):
+            FX = None
+        if FX is not None and FX.shape != (n, n):
+            FX = None
+    if FX is None:
+        FX = np.column_stack([np.asarray(F(X[:, j]), dtype=float) for j in range(n)])
+
+    return ((FX - Fx[:, None]) / h).tolist()
+
+def jacobiana_ad(F, x):
+    # Jacobiana exata por diferenciação automática (modo direto): uma avaliação de F
+    # com números duais por coluna, semeando a direção e_j
+    n = len(x)
+    J = [[0.0] * n for _ in range(n)]
+    for j in range(n):
+        Fj = F([Dual(xi, 1.0 if i == j else 0.0) for i, xi in enumerate(x)])
+        for i, fi in enumerate(Fj):
+            J[i][j] = fi.derivada if isinstance(fi, Dual) else 0.0  # componente constante
+    return J
+
+def newton_sistemas(F, x0, e1, e2, max_i=100, J="diferencas", busca_linear=True, telemetria=None):
+    # Newton para F(x) = 0, com F: R^n -> R^n.
+    # J é a jacobiana analítica (função de x), "diferencas" (uma avaliação de F por coluna),
+    # "diferencas_vetorizada" (todas as colunas numa chamada de F) ou "ad" (números duais).
+    # Com busca_linear, o passo s é reduzido pela metade até satisfazer a condição de Armijo
+    # ||F(x + ts)||² <= (1 - 2αt)||F(x)||², o que dá convergência a partir de pontos ruins.
+    # Retorna (x, k, convergiu).
+    fun = F if telemetria is None else telemetria.contar(F)
+
+    if callable(J):
+        jacobiana = lambda x, Fx: J(x)
+    elif J == "diferencas":
+        jacobiana = lambda x, Fx: jacobiana_diferencas(fun, x, Fx)
+    elif J == "diferencas_vetorizada":
+        jacobiana = lambda x, Fx: jacobiana_diferencas(fun, x, Fx, vetorizada=True)
+    elif J == "ad":
+        jacobiana = lambda x, Fx: jacobiana_ad(fun, x)
+    else:
+        raise ValueError("Jacobiana desconhecida: " + str(J))
+
+    alfa = 1e-4
+    x = [float(xi) for xi in x0]
+    Fx = [float(fi) for fi in fun(np.array(x))]
+
+    for k in range(max_i):
+        if norma(Fx) < e1:
+            return x, k, True
+
+        Jx = jacobiana(x, Fx)
+        if telemetria is not None:
+            telemetria.incrementar("jacobianas")
+
+        # J s = -F pela eliminação de Gauss com pivoteamento (que altera os argumentos)
+        try:
+            s = eliminacao_gauss([linha[:] for linha in Jx], [-fi for fi in Fx])
+        except ValueError:
+            return x, k, False  # jacobiana singular
+
+        t = 1.0
+        norma2 = norma(Fx) ** 2
+        while True:
+            x_novo = [xi + t * si for xi, si in zip(x, s)]
+            F_novo = [float(fi) for fi in fun(np.array(x_novo))]
+            if not busca_linear or norma(F_novo) ** 2 <= (1 - 2 * alfa * t) * norma2:
+                break
+            t /= 2
+            if t < 1e-10:
+                return x, k, False  # s não é direção de descida (jacobiana ruim)
+
+        if telemetria is not None:
+            telemetria.registrar(k + 1, t, norma(F_novo))
+
+        # O passo de Newton completo estima o erro de x (t * s pode ser pequeno só por causa da busca)
+        if norma(s) < e2:
+            return x_novo, k + 1, True
+
+        x, Fx = x_novo, F_novo
+
+    print("Número máximo de iterações atingido:", max_i)
+    return x, max_i, False
+
 # Exemplo:
-x1, x2 = None, None
+# x1 + x2 - 3 = 0
+# x1² + x2² - 9 = 0
+def F(x):
+    x1, x2 = x[0], x[1]
+    return [x1 + x2 - 3, x1**2 + x2**2 - 9]
+
+def J(x):
+    x1, x2 = x
+    return [[1, 1], [2*x1, 2*x2]]
+
+x0 = [1, 5]
+e1 = e2 = 1e-10
+
+print("Jacobiana analítica:", newton_sistemas(F, x0, e1, e2, J=J))
+print("Diferenças finitas:", newton_sistemas(F, x0, e1, e2))
+print("Diferenças finitas vetorizadas:", newton_sistemas(F, x0, e1, e2, J="diferencas_vetorizada"))
+print("Diferenciação automática:", newton_sistemas(F, x0, e1, e2, J="ad"))
 
-A = [x1 + x2 - 3, x1**2 + x2**2 - 9]
+# Ponto inicial ruim: a busca linear evita que o passo de Newton jogue x para longe
+tel = Telemetria()
+with tel:
+    print("Com busca linear:", newton_sistemas(F, [1.5, 1.4], e1, e2, J=J, telemetria=tel))
+tel.imprimir()
+print("Sem busca linear:", newton_sistemas(F, [1.5, 1.4], e1, e2, J=J, busca_linear=False))
 
-J = [[1, 1], [2*x1, 2*x2]]
\ No newline at end of file
+# Jacobiana singular no ponto inicial: retorna sem convergir
+print("Jacobiana singular:", newton_sistemas(F, [0, 0], e1, e2, J=J))
@@ -1,37 +1,89 @@
+import numpy as np
+
+from telemetria import Telemetria
+
 def norma(v):
     return sum(vi**2 for vi in v) ** 0.5
 
-def resolver_sistema_linear(A, b):
+def fatorar_lu(A):
+    # PA = LU com pivoteamento parcial, L e U compactados numa cópia de A; devolve (LU, p)
     n = len(A)
-    x = [0] * n
-    
+    LU = [[float(a) for a in linha] for linha in A]
+    p = list(range(n))
+
+    for k in range(n):
+        r = max(range(k, n), key=lambda i: abs(LU[i][k]))
+        if LU[r][k] == 0:
+            raise ValueError("A matriz é singular.")
+        if r != k:
+            LU[k], LU[r] = LU[r], LU[k]
+            p[k], p[r] = p[r], p[k]
+
+        pivo = LU[k]
+        for i in range(k + 1, n):
+            linha = LU[i]
+            m = linha[k] / pivo[k]
+            linha[k] = m
+            for j in range(k + 1, n):
+                linha[j] -= m * pivo[j]
+
+    return LU, p
+
+def resolver_lu(LU, p, b):
+    # Só as substituições, O(n²), com os fatores de fatorar_lu
+    n = len(LU)
+    y = [b[i] for i in p]
+
     for i in range(n):
-        for j in range(i + 1, n):
-            fator = A[j][i] / A[i][i]
-            b[j] -= fator * b[i]
-            for k in range(i, n):
-                A[j][k] -= fator * A[i][k]
+        y[i] -= sum(LU[i][j] * y[j] for j in range(i))
 
     for i in range(n - 1, -1, -1):
-        soma = sum(A[i][j] * x[j] for j in range(i + 1, n))
-        x[i] = (b[i] - soma) / A[i][i]
-    
-    return x
+        y[i] = (y[i] - sum(LU[i][j] * y[j] for j in range(i + 1, n))) / LU[i][i]
+
+    return y
+
+def newton_modificado(F, J, x0, epsilon1, epsilon2, max_iter=100, metodo="modificado", theta=0.5,
+                      telemetria=None):
+    # metodo: "modificado" (J_k congelada), "broyden_bom" ou "broyden_ruim".
+    # A jacobiana é reavaliada quando a contração observada é fraca: ||F(x_k+1)|| > theta ||F(x_k)||.
+    # No modificado, J_k é fatorada (LU) só quando é reavaliada; as demais iterações fazem
+    # apenas as substituições. A telemetria conta "fatoracoes" e "solucoes" separadamente
+    # e registra, a cada iteração, ||s_k|| e ||F(x_k)||.
+    if metodo in ("broyden_bom", "broyden_ruim"):
+        return broyden(F, J, x0, epsilon1, epsilon2, max_iter, metodo == "broyden_bom", theta, telemetria)
+    if metodo != "modificado":
+        raise ValueError("Método desconhecido: " + str(metodo))
 
-def newton_modificado(F, J, x0, epsilon1, epsilon2, max_iter=100):
+    fun = F if telemetria is None else telemetria.contar(F)
     x_k = x0[:]  
     J_k = J(x_k)  
+    fatores = None
+    norma_anterior = None
     
     for k in range(max_iter):
-        F_k = F(x_k)
+        F_k = fun(x_k)
+        norma_F = norma(F_k)
 
-        if norma(F_k) < epsilon1:
+        if norma_F < epsilon1:
             return x_k, k, True
 
-        try:
-            s_k = resolver_sistema_linear([row[:] for row in J_k], [-fi for fi in F_k])
-        except ZeroDivisionError:
-            return x_k, k, False  
+        if norma_anterior is not None and norma_F > theta * norma_anterior:
+            J_k = J(x_k)
+            fatores = None
+        norma_anterior = norma_F
+
+        if fatores is None:
+            try:
+                fatores = fatorar_lu(J_k)
+            except ValueError:
+                return x_k, k, False
+            if telemetria is not None:
+                telemetria.incrementar("fatoracoes")
+
+        s_k = resolver_lu(*fatores, [-fi for fi in F_k])
+        if telemetria is not None:
+            telemetria.incrementar("solucoes")
+            telemetria.registrar(k + 1, norma(s_k), norma_F)
         
         x_k_plus_1 = [x_k[i] + s_k[i] for i in range(len(x_k))]
 
@@ -40,7 +92,85 @@ def newton_modificado(F, J, x0, epsilon1, epsilon2, max_iter=100):
 
         x_k = x_k_plus_1
 
-        if k % 5 == 0:  
-            J_k = J(x_k)
+    return x_k, max_iter, False
+
+def broyden(F, J, x0, epsilon1, epsilon2, max_iter=100, bom=True, theta=0.5, telemetria=None):
+    # Quasi-Newton de Broyden guardando H ≈ J^-1: cada iteração custa O(n²) (produtos
+    # matriz-vetor e uma atualização de posto um de Sherman-Morrison), sem resolver sistemas.
+    #   bom:  H += (s - H y) sᵀH / (sᵀ H y)   (atualiza J com a menor mudança que satisfaz J s = y)
+    #   ruim: H += (s - H y) yᵀ / (yᵀ y)      (atualiza H com a menor mudança que satisfaz H y = s)
+    # Quando ||F(x_k+1)|| > theta ||F(x_k)||, H é recalculada a partir da jacobiana verdadeira.
+    # A telemetria conta as inversões ("inversoes") e as atualizações de posto um ("atualizacoes").
+    fun = F if telemetria is None else telemetria.contar(F)
+    x = np.array(x0, dtype=float)
+    F_x = np.asarray(fun(x), dtype=float)
+
+    try:
+        H = np.linalg.inv(np.array(J(x), dtype=float))
+    except np.linalg.LinAlgError:
+        return x.tolist(), 0, False
+    if telemetria is not None:
+        telemetria.incrementar("inversoes")
+
+    for k in range(max_iter):
+        if np.linalg.norm(F_x) < epsilon1:
+            return x.tolist(), k, True
+
+        s = -(H @ F_x)
+        x_novo = x + s
+        F_novo = np.asarray(fun(x_novo), dtype=float)
+        if telemetria is not None:
+            telemetria.registrar(k + 1, np.linalg.norm(s), np.linalg.norm(F_novo))
+
+        if np.linalg.norm(s) < epsilon2:
+            return x_novo.tolist(), k + 1, True
+
+        if np.linalg.norm(F_novo) > theta * np.linalg.norm(F_x):
+            try:
+                H = np.linalg.inv(np.array(J(x_novo), dtype=float))
+            except np.linalg.LinAlgError:
+                return x_novo.tolist(), k + 1, False
+            if telemetria is not None:
+                telemetria.incrementar("inversoes")
+        else:
+            y = F_novo - F_x
+            Hy = H @ y
+            if bom:
+                sH = s @ H
+                denominador = sH @ y
+            else:
+                sH = y
+                denominador = y @ y
+            if denominador != 0:
+                H += np.outer(s - Hy, sH) / denominador
+                if telemetria is not None:
+                    telemetria.incrementar("atualizacoes")
+
+        x, F_x = x_novo, F_novo
+
+    print("Número máximo de iterações atingido:", max_iter)
+    return x.tolist(), max_iter, False
+
+# Exemplo: função tridiagonal de Broyden, F_i = (3 - 2x_i) x_i - x_(i-1) - 2x_(i+1) + 1
+def F(x):
+    x = np.asarray(x, dtype=float)
+    anterior = np.concatenate([[0.0], x[:-1]])
+    seguinte = np.concatenate([x[1:], [0.0]])
+    return (3 - 2*x) * x - anterior - 2*seguinte + 1
+
+def J(x):
+    n = len(x)
+    return (np.diag(3 - 4*np.asarray(x, dtype=float)) - np.eye(n, k=-1) - 2*np.eye(n, k=1)).tolist()
+
+tel = Telemetria()
+with tel:
+    print("Newton modificado (n = 20):", newton_modificado(F, J, [-1.0] * 20, 1e-10, 1e-12, telemetria=tel)[1:])
+tel.imprimir()
 
-    return x_k, max_iter, False  
+n = 500
+for metodo in ["broyden_bom", "broyden_ruim"]:
+    tel = Telemetria()
+    with tel:
+        x, k, ok = newton_modificado(F, J, [-1.0] * n, 1e-10, 1e-12, metodo=metodo, telemetria=tel)
+    print(f"{metodo} (n = {n}): {k} iterações, convergiu: {ok}, ||F|| = {np.linalg.norm(F(x)):.2e}")
+    print(tel.contadores)
@@ -0,0 +1,175 @@
+# V
+
+import numpy as np
+
+from matriz_esparsa import MatrizCSR
+from metodos_krylov import bicgstab, gmres, precondicionador_jacobi
+from sistemas_banda import FatoracaoBanda, thomas
+from telemetria import Telemetria
+
+# Newton para F(x) = 0 com jacobiana esparsa (sistemas vindos de EDPs discretizadas).
+# O padrão de esparsidade (uma MatrizCSR em que só a posição dos não nulos importa) permite
+# calcular a jacobiana por diferenças finitas com a coloração de colunas de Curtis-Powell-Reid:
+# colunas sem linhas em comum recebem a mesma cor e são perturbadas juntas, então cada
+# jacobiana custa (número de cores) avaliações de F em vez de n.
+
+def colorir_colunas(padrao):
+    # Coloração gulosa do grafo de interseção de colunas: j e k são vizinhas quando
+    # alguma linha tem não nulos nas duas. Devolve a cor de cada coluna.
+    n = padrao.forma[1]
+    linhas, colunas = padrao.linhas(), padrao.indices
+    por_linha = np.diff(padrao.ponteiros)
+
+    # Todos os pares (j, k) de colunas que aparecem na mesma linha
+    repeticoes = por_linha[linhas]
+    p = np.repeat(np.arange(padrao.nnz), repeticoes)
+    deslocamento = np.arange(len(p)) - np.repeat(np.cumsum(repeticoes) - repeticoes, repeticoes)
+    q = padrao.ponteiros[linhas[p]] + deslocamento
+    j, k = colunas[p], colunas[q]
+    fora = j != k
+    vizinhos = MatrizCSR.de_coordenadas(j[fora], k[fora], np.ones(np.count_nonzero(fora)), (n, n))
+
+    indices = vizinhos.indices.tolist()
+    ponteiros = vizinhos.ponteiros.tolist()
+    cor = [-1] * n
+
+    for i in range(n):
+        usadas = {cor[v] for v in indices[ponteiros[i]:ponteiros[i + 1]]}
+        c = 0
+        while c in usadas:
+            c += 1
+        cor[i] = c
+
+    return np.array(cor)
+
+def jacobiana_esparsa(F, x, padrao, cores, Fx=None):
+    # Diferenças progressivas agrupadas por cor: a linha i da diferença F(x + d) - F(x)
+    # só depende da única coluna j dessa cor com a_ij != 0
+    x = np.asarray(x, dtype=float)
+    Fx = np.asarray(F(x) if Fx is None else Fx, dtype=float)
+    h = np.sqrt(np.finfo(float).eps) * np.maximum(np.abs(x), 1.0)
+
+    linhas, colunas = padrao.linhas(), padrao.indices
+    cor_do_elemento = cores[colunas]
+    dados = np.zeros(padrao.nnz)
+
+    for c in range(cores.max() + 1):
+        d = np.where(cores == c, h, 0.0)
+        diferenca = np.asarray(F(x + d), dtype=float) - Fx
+        desta_cor = cor_do_elemento == c
+        dados[desta_cor] = diferenca[linhas[desta_cor]] / h[colunas[desta_cor]]
+
+    return MatrizCSR(dados, colunas, padrao.ponteiros, padrao.forma)
+
+def largura_banda_csr(A):
+    deslocamento = A.linhas() - A.indices
+    if A.nnz == 0:
+        return 0, 0
+    return max(int(deslocamento.max()), 0), max(int(-deslocamento.min()), 0)
+
+def resolver_banda_csr(A, b, p, q):
+    # Thomas quando tridiagonal; senão LU em banda montada direto das triplas da CSR
+    n = A.forma[0]
+    linhas, colunas = A.linhas(), A.indices
+
+    if p <= 1 and q <= 1:
+        diagonais = [np.zeros(n - 1), np.zeros(n), np.zeros(n - 1)]
+        for deslocamento, diagonal in zip([-1, 0, 1], diagonais):
+            nesta = colunas - linhas == deslocamento
+            diagonal[np.minimum(linhas[nesta], colunas[nesta])] = A.dados[nesta]
+        try:
+            return np.array(thomas(*diagonais, b))
+        except ValueError:
+            pass  # pivô nulo: usa a fatoração com pivoteamento
+
+    AB = np.zeros((2*p + q + 1, n))
+    AB[p + q + linhas - colunas, colunas] = A.dados
+    return FatoracaoBanda.de_diagonais(AB, p, q).resolver(b)
+
+def newton_esparso(F, x0, padrao, e1, e2, max_i=50, resolvedor="auto", tol_linear=1e-8,
+                   max_linear=1000, telemetria=None):
+    # F: R^n -> R^n com operações de array; padrao: MatrizCSR com os não nulos da jacobiana.
+    # resolvedor: "banda" (Thomas / LU em banda), "gmres", "bicgstab" (ambos com precondicionador
+    # de Jacobi) ou "auto", que usa a banda quando p + q <= 4 e BiCGSTAB caso contrário.
+    # Retorna (x, k, convergiu).
+    fun = F if telemetria is None else telemetria.contar(F)
+    cores = colorir_colunas(padrao)
+    p, q = largura_banda_csr(padrao)
+    if resolvedor == "auto":
+        resolvedor = "banda" if p + q <= 4 else "bicgstab"
+    if resolvedor not in ("banda", "gmres", "bicgstab"):
+        raise ValueError("Resolvedor desconhecido: " + str(resolvedor))
+
+    x = np.array(x0, dtype=float)
+    Fx = np.asarray(fun(x), dtype=float)
+
+    for k in range(max_i):
+        if np.linalg.norm(Fx) < e1:
+            return x, k, True
+
+        J = jacobiana_esparsa(fun, x, padrao, cores, Fx)
+        if telemetria is not None:
+            telemetria.incrementar("jacobianas")
+
+        if resolvedor == "banda":
+            s = resolver_banda_csr(J, -Fx, p, q)
+        else:
+            metodo = gmres if resolvedor == "gmres" else bicgstab
+            s, iteracoes = metodo(J, -Fx, tol_linear, max_linear, M=precondicionador_jacobi(J))
+            if telemetria is not None:
+                telemetria.incrementar("iteracoes_lineares", iteracoes)
+
+        x = x + s
+        Fx = np.asarray(fun(x), dtype=float)
+        if telemetria is not None:
+            telemetria.registrar(k + 1, np.linalg.norm(s), np.linalg.norm(Fx))
+
+        if np.linalg.norm(s) < e2 * max(np.linalg.norm(x), 1.0):
+            return x, k + 1, True
+
+    print("Número máximo de iterações atingido:", max_i)
+    return x, max_i, False
+
+# Exemplo: problema de Bratu, -Δu = λ e^u com u = 0 na fronteira
+lam = 1.0
+
+# 1D com 100000 pontos: jacobiana tridiagonal, 3 cores, resolvida por Thomas
+n = 100_000
+h = 1 / (n + 1)
+
+def F_1d(u):
+    vizinhos = np.concatenate([[0.0], u[:-1]]) + np.concatenate([u[1:], [0.0]])
+    return 2*u - vizinhos - h**2 * lam * np.exp(u)
+
+i = np.arange(n)
+padrao = MatrizCSR.de_coordenadas(np.concatenate([i, i[1:], i[:-1]]),
+                                  np.concatenate([i, i[:-1], i[1:]]), np.ones(3*n - 2), (n, n))
+print("Cores (1D):", colorir_colunas(padrao).max() + 1)
+
+tel = Telemetria()
+with tel:
+    u, k, ok = newton_esparso(F_1d, np.zeros(n), padrao, 1e-10, 1e-12, telemetria=tel)
+print(f"1D: {k} iterações, convergiu: {ok}, max u = {u.max():.6f}")
+tel.imprimir()
+
+# 2D numa grade 150 x 150 (estêncil de 5 pontos): BiCGSTAB com Jacobi
+m = 150
+h2 = (1 / (m + 1))**2
+linha, coluna = np.divmod(np.arange(m * m), m)
+
+def F_2d(u):
+    U = np.pad(u.reshape(m, m), 1)
+    vizinhos = U[:-2, 1:-1] + U[2:, 1:-1] + U[1:-1, :-2] + U[1:-1, 2:]
+    return 4*u - vizinhos.ravel() - h2 * lam * np.exp(u)
+
+linhas, colunas = [np.arange(m * m)], [np.arange(m * m)]
+for dl, dc in [(0, 1), (0, -1), (1, 0), (-1, 0)]:
+    dentro = (0 <= linha + dl) & (linha + dl < m) & (0 <= coluna + dc) & (coluna + dc < m)
+    linhas.append(np.flatnonzero(dentro))
+    colunas.append((linha + dl)[dentro] * m + (coluna + dc)[dentro])
+linhas, colunas = np.concatenate(linhas), np.concatenate(colunas)
+padrao = MatrizCSR.de_coordenadas(linhas, colunas, np.ones(len(linhas)), (m * m, m * m))
+print("Cores (2D):", colorir_colunas(padrao).max() + 1)
+
+u, k, ok = newton_esparso(F_2d, np.zeros(m * m), padrao, 1e-10, 1e-12)
+print(f"2D: {k} iterações, convergiu: {ok}, max u = {u.max():.6f}")
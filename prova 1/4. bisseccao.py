@@ -1,30 +1,85 @@
 # V V V
 
-def bisseccao(a, b, e):
+import numpy as np
+
+from telemetria import Telemetria
+
+def bisseccao(a, b, e, telemetria=None):
+    fun = f if telemetria is None else telemetria.contar(f)
+
     # Regra do sinal: para existir raíz nesse intervalo, deve-se atender a esse critério
-    if f(a) * f(b) >= 0:
+    if fun(a) * fun(b) >= 0:
         raise ValueError("Nesse intervalo não existe raíz")
 
     i = 1
     ai = a
     bi = b
 
-    print("Valores iniciais: a =", ai, "b =", bi, )
-
     while abs(bi - ai) > e: # critério de parada: quando a precisão bi - ai < 0
         xi = (ai + bi) / 2
 
-        if f(ai) * f(xi) < 0:
+        if fun(ai) * fun(xi) < 0:
             bi = xi
         else:
             ai = xi
 
-        print(f"Iteração {i}: a{i} = {ai}, b{i} = {bi}, x{i} = {xi}")
+        if telemetria is not None:
+            telemetria.registrar(i, xi, a=ai, b=bi)
 
         i += 1
 
     return (ai + bi)/2
 
+def bisseccao_vetorizada(f, a, b, e, max_i=100):
+    # Versão em lote: a e b são arrays de intervalos e f deve aceitar arrays (NumPy)
+    ai = np.array(a, dtype=float)
+    bi = np.array(b, dtype=float)
+    ai, bi = np.broadcast_arrays(ai, bi)
+    ai, bi = ai.copy(), bi.copy()
+
+    # Valores de f nos extremos esquerdos ficam guardados: só f(xi) é calculado a cada iteração
+    fa = np.asarray(f(ai), dtype=float)
+    fb = np.asarray(f(bi), dtype=float)
+
+    # Regra do sinal aplicada a cada intervalo
+    if np.any(fa * fb > 0):
+        raise ValueError("Em algum dos intervalos não existe raíz")
+
+    iteracoes = np.zeros(ai.shape, dtype=int)
+
+    # Intervalos que já começam com raíz exata num dos extremos
+    # (np.asarray: com intervalos escalares a máscara seria um bool NumPy, não um array gravável)
+    ativos = np.asarray((abs(bi - ai) > e) & (fa != 0) & (fb != 0), dtype=bool)
+    bi = np.where(fa == 0, ai, bi)
+    ai = np.where(fb == 0, bi, ai)
+
+    for i in range(1, max_i + 1):
+        idx = np.flatnonzero(ativos)
+        if idx.size == 0:
+            break
+
+        xi = (ai.flat[idx] + bi.flat[idx]) / 2
+        fx = np.asarray(f(xi), dtype=float)  # única avaliação de f na iteração
+
+        esquerda = fa.flat[idx] * fx < 0
+        direita = ~esquerda
+
+        bi.flat[idx[esquerda]] = xi[esquerda]
+        ai.flat[idx[direita]] = xi[direita]
+        fa.flat[idx[direita]] = fx[direita]
+
+        # Raíz exata: o intervalo colapsa no ponto médio
+        exato = fx == 0
+        ai.flat[idx[exato]] = xi[exato]
+        bi.flat[idx[exato]] = xi[exato]
+
+        iteracoes.flat[idx] = i
+
+        # Critério de parada de cada intervalo: bi - ai <= e
+        ativos.flat[idx] = abs(bi.flat[idx] - ai.flat[idx]) > e
+
+    return (ai + bi) / 2, iteracoes
+
 # Exemplo:
 def f(x):
     return x**3 - 3*x - 1
@@ -35,4 +90,15 @@ b = 0
 
 e = 0.15 # precisão
 
-print(bisseccao(a, b, e))
\ No newline at end of file
+tel = Telemetria(capacidade=100)
+with tel:
+    print(bisseccao(a, b, e, telemetria=tel))
+tel.imprimir()
+
+# Exemplo em lote: vários intervalos resolvidos de uma vez
+a_lote = np.array([-2.0, -1.0, 1.0])
+b_lote = np.array([-1.0, 0.0, 2.0])
+
+raizes, iteracoes = bisseccao_vetorizada(f, a_lote, b_lote, 1e-10)
+print("Raízes:", raizes)
+print("Iterações:", iteracoes)
\ No newline at end of file
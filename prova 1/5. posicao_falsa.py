@@ -2,39 +2,42 @@
 
 from math import e
 
-def posicao_falsa(a, b, e1, e2):
+from telemetria import Telemetria
+
+def posicao_falsa(a, b, e1, e2, telemetria=None):
+    fun = f if telemetria is None else telemetria.contar(f)
+
     # Regra do sinal: para existir raíz nesse intervalo, deve-se atender a esse critério
-    if f(a) * f(b) >= 0:
+    if fun(a) * fun(b) >= 0:
         raise ValueError("Nesse intervalo não existe raíz")
 
     k = 1
 
-    print(f"Valores iniciais: a = {a}, b = {b}")
-
     # Verificar se o intervalo é pequeno o suficiente (ou seja, se a precisão é alta)
     if abs(b - a) < e1:
-        if abs(f(a)) < e2:
+        if abs(fun(a)) < e2:
             return a
-        elif abs(f(b)) < e2:
+        elif abs(fun(b)) < e2:
             return b
         else:
             return (a + b) / 2
 
     while True:
         # Calcula o ponto de posição falsa
-        x = (a * f(b) - b * f(a)) / (f(b) - f(a))
+        x = (a * fun(b) - b * fun(a)) / (fun(b) - fun(a))
 
         # Verificar se o valor de f(x) é pequeno o suficiente
-        if abs(f(x)) < e2:
+        if abs(fun(x)) < e2:
             return x
 
         # Atualizar os limites do intervalo
-        if f(a) * f(x) > 0:
+        if fun(a) * fun(x) > 0:
             a = x
         else:
             b = x
 
-        print(f"Iteração {k}: a{k} = {a}, b{k}, = {b}")
+        if telemetria is not None:
+            telemetria.registrar(k, x, a=a, b=b)
 
         # Critério de parada baseado no intervalo
         if abs(b - a) < e1:
@@ -42,6 +45,59 @@ def posicao_falsa(a, b, e1, e2):
 
         k += 1
 
+def posicao_falsa_modificada(f, a, b, e1, e2, metodo="illinois", max_i=100, telemetria=None):
+    # Posição falsa com peso no extremo que fica parado (Illinois, Pegasus ou Anderson-Björck)
+    # Retorna a raíz e a quantidade de avaliações de f usadas até atingir a precisão
+    if metodo not in ("classico", "illinois", "pegasus", "anderson_bjorck"):
+        raise ValueError("Método não suportado.")
+
+    if telemetria is not None:
+        f = telemetria.contar(f)
+
+    # Valores de f ficam guardados: cada iteração faz uma única avaliação
+    fa = f(a)
+    fb = f(b)
+    avaliacoes = 2
+
+    # Regra do sinal: para existir raíz nesse intervalo, deve-se atender a esse critério
+    if fa * fb >= 0:
+        raise ValueError("Nesse intervalo não existe raíz")
+
+    x = b
+    for k in range(1, max_i + 1):
+        # Calcula o ponto de posição falsa
+        x = (a * fb - b * fa) / (fb - fa)
+        fx = f(x)
+        avaliacoes += 1
+
+        # Verificar se o valor de f(x) é pequeno o suficiente
+        if abs(fx) < e2:
+            return x, avaliacoes
+
+        if fx * fb < 0:
+            # Raíz entre x e b: b passa a ser o extremo a
+            a, fa = b, fb
+        else:
+            # O extremo a ficaria parado mais uma vez: o peso reduz f(a)
+            if metodo == "illinois":
+                fa *= 0.5
+            elif metodo == "pegasus":
+                fa *= fb / (fb + fx)
+            elif metodo == "anderson_bjorck":
+                m = 1 - fx / fb
+                fa *= m if m > 0 else 0.5
+        b, fb = x, fx
+
+        if telemetria is not None:
+            telemetria.registrar(k, x, fx, a, b)
+
+        # Critério de parada baseado no intervalo
+        if abs(b - a) < e1:
+            return x, avaliacoes
+
+    print("Número máximo de iterações atingido:", max_i)
+    return x, avaliacoes
+
 # Exemplo:
 def f(x):
     return e**(-2*x) - x**2
@@ -54,4 +110,11 @@ b = 2
 e1 = 1e-6
 e2 = 1e-6
 
-print("Resultado:", posicao_falsa(a, b, e1, e2))
\ No newline at end of file
+tel = Telemetria(capacidade=100)
+with tel:
+    print("Resultado:", posicao_falsa(a, b, e1, e2, telemetria=tel))
+tel.imprimir()
+
+# Comparação das variantes (raíz, avaliações de f):
+for metodo in ["classico", "illinois", "pegasus", "anderson_bjorck"]:
+    print(metodo, posicao_falsa_modificada(f, a, b, e1, e2, metodo))
\ No newline at end of file
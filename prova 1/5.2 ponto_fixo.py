@@ -0,0 +1,182 @@
+import math
+import numpy as np
+
+from telemetria import Telemetria
+
+# Códigos de situação de cada posição na versão vetorizada
+CONVERGIU = 0
+MAX_ITERACOES = 1
+DIVERGIU = 2
+
+def aitken(x0, x1, x2):
+    # Extrapolação Δ² de Aitken a partir de três iterados consecutivos
+    denominador = x2 - 2*x1 + x0
+    if denominador == 0:
+        return x2
+    return x0 - (x1 - x0)**2 / denominador
+
+def ponto_fixo(g, x0, e, max_i=100, aceleracao=None, telemetria=None):
+    # Iteração x_{k+1} = g(x_k), com aceleração opcional ("aitken" ou "steffensen")
+    # Retorna a aproximação, o número de iterações e a taxa de contração estimada |g'(x*)|
+    if aceleracao not in (None, "aitken", "steffensen"):
+        raise ValueError("Aceleração não suportada.")
+
+    if telemetria is not None:
+        g = telemetria.contar(g)
+
+    x = x0
+    x_anterior = None      # iterado anterior do método simples (usado por Aitken)
+    estimativa = None      # última aproximação acelerada
+    passo_anterior = None
+    taxa = None
+    crescimentos = 0       # iterações seguidas em que o passo aumentou
+
+    for k in range(1, max_i + 1):
+        x1 = g(x)
+
+        if aceleracao == "steffensen":
+            # Steffensen: reinicia a iteração a partir do ponto extrapolado
+            x2 = g(x1)
+            passo = abs(x1 - x)
+            if passo > 0:
+                taxa = abs(x2 - x1) / passo
+            x_novo = aitken(x, x1, x2)
+            passo = abs(x_novo - x)
+        else:
+            passo = abs(x1 - x)
+            if passo_anterior:
+                taxa = passo / passo_anterior
+            x_novo = x1
+
+        if not math.isfinite(x_novo):
+            raise ValueError("O método diverge: iterado não finito na iteração {}.".format(k))
+
+        if telemetria is not None:
+            telemetria.registrar(k, x_novo)
+
+        if aceleracao == "aitken":
+            # Aitken só extrapola: a sequência do método simples continua normalmente
+            if x_anterior is not None:
+                nova_estimativa = aitken(x_anterior, x, x1)
+                if estimativa is not None and abs(nova_estimativa - estimativa) < e:
+                    return nova_estimativa, k, taxa
+                estimativa = nova_estimativa
+            x_anterior = x
+
+        # Critério de parada: |x_{k+1} - x_k| < e
+        if passo < e:
+            return (estimativa if aceleracao == "aitken" and estimativa is not None else x_novo), k, taxa
+
+        # Detecção de divergência: o passo cresce por três iterações seguidas
+        if passo_anterior is not None:
+            crescimentos = crescimentos + 1 if passo > passo_anterior else 0
+            if crescimentos >= 3:
+                raise ValueError("O método diverge: |g'(x)| > 1 perto de x = {:.6f}.".format(x_novo))
+
+        passo_anterior = passo
+        x = x_novo
+
+    print("Número máximo de iterações atingido:", max_i)
+    return x, max_i, taxa
+
+def ponto_fixo_vetorizado(g, x0, e, max_i=100, aceleracao=None, args=()):
+    # Várias iterações de ponto fixo de uma vez: g aceita arrays e args são parâmetros
+    # por posição, de modo que cada posição pode ter a sua própria função de iteração.
+    # Retorna, por posição, a aproximação, as iterações, a situação e a taxa de contração
+    # estimada |g'(x*)| (NaN enquanto não há passos suficientes para estimá-la)
+    if aceleracao not in (None, "aitken", "steffensen"):
+        raise ValueError("Aceleração não suportada.")
+
+    x = np.array(x0, dtype=float).ravel()
+    n = x.size
+    args = tuple(np.broadcast_to(np.asarray(p), (n,)) for p in args)
+
+    iteracoes = np.zeros(n, dtype=int)
+    situacao = np.full(n, MAX_ITERACOES)
+    passo_anterior = np.full(n, np.inf)
+    crescimentos = np.zeros(n, dtype=int)
+    taxa = np.full(n, np.nan)
+    x_anterior = np.full(n, np.nan)   # iterado anterior do método simples (Aitken)
+    estimativa = np.full(n, np.nan)   # última aproximação extrapolada (Aitken)
+    ativos = np.arange(n)
+
+    for k in range(1, max_i + 1):
+        if ativos.size == 0:
+            break
+
+        p = tuple(arg[ativos] for arg in args)
+        xa = x[ativos]
+        x1 = np.asarray(g(xa, *p), dtype=float)
+
+        if aceleracao == "steffensen":
+            x2 = np.asarray(g(x1, *p), dtype=float)
+            passo1 = abs(x1 - xa)
+            taxa[ativos] = np.divide(abs(x2 - x1), passo1, out=taxa[ativos], where=passo1 > 0)
+            denominador = x2 - 2*x1 + xa
+            seguro = np.where(denominador == 0, 1.0, denominador)
+            x_novo = np.where(denominador == 0, x2, xa - (x1 - xa)**2 / seguro)
+        else:
+            x_novo = x1
+
+        passo = abs(x_novo - xa)
+        if aceleracao != "steffensen":
+            anterior = passo_anterior[ativos]
+            taxa[ativos] = np.divide(passo, anterior, out=taxa[ativos],
+                                     where=np.isfinite(anterior) & (anterior > 0))
+        x[ativos] = x_novo
+        iteracoes[ativos] = k
+
+        # Aitken só extrapola: a sequência do método simples continua normalmente, e a
+        # posição para quando duas extrapolações seguidas diferem menos que e
+        convergiu_aitken = np.zeros(ativos.size, dtype=bool)
+        if aceleracao == "aitken":
+            xp = x_anterior[ativos]
+            denominador = x1 - 2*xa + xp
+            seguro = np.where(denominador == 0, 1.0, denominador)
+            nova = np.where(denominador == 0, x1, xp - (xa - xp)**2 / seguro)
+            convergiu_aitken = abs(nova - estimativa[ativos]) < e
+            estimativa[ativos] = nova
+            x_anterior[ativos] = xa
+
+        crescimentos[ativos] = np.where(passo > passo_anterior[ativos], crescimentos[ativos] + 1, 0)
+        passo_anterior[ativos] = passo
+
+        convergiu = (passo < e) | convergiu_aitken
+        divergiu = ~np.isfinite(x_novo) | (crescimentos[ativos] >= 3)
+        situacao[ativos[convergiu]] = CONVERGIU
+        situacao[ativos[divergiu & ~convergiu]] = DIVERGIU
+
+        ativos = ativos[~(convergiu | divergiu)]
+
+    if aceleracao == "aitken":
+        x = np.where(np.isnan(estimativa), x, estimativa)
+
+    forma = np.shape(x0)
+    return x.reshape(forma), iteracoes.reshape(forma), situacao.reshape(forma), taxa.reshape(forma)
+
+# Exemplo: x = cos(x)
+def g(x):
+    return math.cos(x)
+
+x0 = 1
+e = 1e-10
+
+print("Simples:", ponto_fixo(g, x0, e))
+print("Aitken:", ponto_fixo(g, x0, e, aceleracao="aitken"))
+print("Steffensen:", ponto_fixo(g, x0, e, aceleracao="steffensen"))
+
+tel = Telemetria(capacidade=100)
+with tel:
+    ponto_fixo(g, x0, e, aceleracao="steffensen", telemetria=tel)
+tel.imprimir()
+
+# Exemplo vetorizado: x = c*cos(x) para vários valores de c
+c = np.array([0.5, 0.8, 1.0, 3.0])
+x, iteracoes, situacao, taxa = ponto_fixo_vetorizado(lambda x, c: c*np.cos(x), np.ones_like(c), e, aceleracao="steffensen", args=(c,))
+print("Pontos fixos:", x)
+print("Iterações:", iteracoes)
+print("Situação:", situacao)
+print("Taxa de contração:", taxa)
+
+x, iteracoes, situacao, taxa = ponto_fixo_vetorizado(lambda x, c: c*np.cos(x), np.ones_like(c), e, aceleracao="aitken", args=(c,))
+print("Aitken:", x, iteracoes, situacao, taxa)
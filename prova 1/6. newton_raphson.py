@@ -1,28 +1,123 @@
 # V V
 
-def newton_raphson(x0, e1, e2):
+import numpy as np
+
+from numeros_duais import valor_e_derivada, e, cos
+from telemetria import Telemetria
+
+# Códigos de situação de cada posição na versão vetorizada
+CONVERGIU = 0
+DERIVADA_ZERO = 1
+MAX_ITERACOES = 2
+DIVERGIU = 3
+
+def newton_raphson(x0, e1, e2, telemetria=None):
+    fun = f if telemetria is None else telemetria.contar(f)
+    dfun = df if telemetria is None else telemetria.contar(df)
+
     # Verifica se o ponto inicial já é solução
-    if abs(f(x0)) < e1:
+    if abs(fun(x0)) < e1:
         return x0 # retorna aproximação inicial
     
     k = 0  # Contador de iterações
     
     while True:
         # Verifica se a derivada é zero para evitar divisão por zero
-        if df(x0) == 0:
+        if dfun(x0) == 0:
             raise ValueError("A derivada é zero em x = {:.6f}. Método falhou.".format(x0))
         
         # Calcula a próxima iteração
-        x1 = x0 - f(x0) / df(x0)
+        x1 = x0 - fun(x0) / dfun(x0)
+
+        if telemetria is not None:
+            telemetria.registrar(k + 1, x1)
         
         # Critérios de parada: quando f(x1) < e1 ou x1 - x0 < e2
-        if abs(f(x1)) < e1 or abs(x1 - x0) < e2:
+        if abs(fun(x1)) < e1 or abs(x1 - x0) < e2:
             return x1  # Retorna a raiz encontrada
         
         # Atualiza x0 para a próxima iteração
         x0 = x1
         k += 1
     
+def newton_raphson_vetorizado(f, df, x0, e1, e2, max_i=100, args=()):
+    # Resolve várias equações independentes de uma vez: x0 é um array de chutes iniciais,
+    # f e df aceitam arrays e args são parâmetros por posição (um valor por equação)
+    x = np.array(x0, dtype=float).ravel()
+    n = x.size
+    args = tuple(np.broadcast_to(np.asarray(p), (n,)) for p in args)
+
+    iteracoes = np.zeros(n, dtype=int)
+    situacao = np.full(n, MAX_ITERACOES)
+
+    # Verifica se o ponto inicial já é solução
+    fx = np.asarray(f(x, *args), dtype=float)
+    ativos = np.flatnonzero(abs(fx) >= e1)
+    situacao[abs(fx) < e1] = CONVERGIU
+    fx = fx[ativos]
+
+    for k in range(1, max_i + 1):
+        if ativos.size == 0:
+            break
+
+        p = tuple(arg[ativos] for arg in args)
+        dfx = np.asarray(df(x[ativos], *p), dtype=float)
+
+        # Posições com derivada zero são congeladas
+        zero = dfx == 0
+        situacao[ativos[zero]] = DERIVADA_ZERO
+        ativos, fx, dfx = ativos[~zero], fx[~zero], dfx[~zero]
+        p = tuple(arg[~zero] for arg in p)
+
+        # Calcula a próxima iteração
+        x_antigo = x[ativos]
+        x1 = x_antigo - fx / dfx
+        x[ativos] = x1
+        iteracoes[ativos] = k
+
+        fx = np.asarray(f(x1, *p), dtype=float)
+
+        # Critérios de parada: quando f(x1) < e1 ou x1 - x0 < e2
+        convergiu = (abs(fx) < e1) | (abs(x1 - x_antigo) < e2)
+        divergiu = ~np.isfinite(x1) | ~np.isfinite(fx)
+        situacao[ativos[convergiu & ~divergiu]] = CONVERGIU
+        situacao[ativos[divergiu]] = DIVERGIU
+
+        continua = ~(convergiu | divergiu)
+        ativos, fx = ativos[continua], fx[continua]
+
+    return x.reshape(np.shape(x0)), iteracoes.reshape(np.shape(x0)), situacao.reshape(np.shape(x0))
+
+def newton_raphson_ad(f, x0, e1, e2, max_i=100, telemetria=None):
+    # f e f' vêm de uma única avaliação de f com números duais: não é preciso escrever df
+    if telemetria is not None:
+        f = telemetria.contar(f)
+
+    fx, dfx = valor_e_derivada(f, x0)
+
+    # Verifica se o ponto inicial já é solução
+    if abs(fx) < e1:
+        return x0
+
+    for k in range(max_i):
+        # Verifica se a derivada é zero para evitar divisão por zero
+        if dfx == 0:
+            raise ValueError("A derivada é zero em x = {:.6f}. Método falhou.".format(x0))
+
+        x1 = x0 - fx / dfx
+        fx, dfx = valor_e_derivada(f, x1)
+
+        if telemetria is not None:
+            telemetria.registrar(k + 1, x1, fx)
+
+        # Critérios de parada: quando f(x1) < e1 ou x1 - x0 < e2
+        if abs(fx) < e1 or abs(x1 - x0) < e2:
+            return x1
+
+        x0 = x1
+
+    print("Número máximo de iterações atingido:", max_i)
+    return x0
 
 # Exemplo:
 def f(x):
@@ -37,4 +132,19 @@ e1, e2 = 1e-6, 1e-6
 # chute inicial
 x0 = 1
 
-print(newton_raphson(x0, e1, e2))
\ No newline at end of file
+tel = Telemetria(capacidade=100)
+with tel:
+    print(newton_raphson(x0, e1, e2, telemetria=tel))
+tel.imprimir()
+
+# Exemplo vetorizado: raíz quadrada de vários números, x**2 - c = 0 para cada c
+c = np.array([2.0, 3.0, 10.0, 0.0, 1e6])
+x0_lote = np.ones_like(c)
+
+raizes, iteracoes, situacao = newton_raphson_vetorizado(lambda x, c: x**2 - c, lambda x, c: 2*x, x0_lote, 1e-12, 1e-12, args=(c,))
+print("Raízes:", raizes)
+print("Iterações:", iteracoes)
+print("Situação:", situacao)
+
+# Exemplo com derivada automática (mesma função do método da secante)
+print(newton_raphson_ad(lambda x: e**(-x**2) - cos(x), 1.5, e1, e2))
\ No newline at end of file
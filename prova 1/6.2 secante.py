@@ -2,8 +2,12 @@
 
 import math
 
-def secante(x0, x1, e1, e2):
-    if abs(f(x0)) < e1:
+from telemetria import Telemetria
+
+def secante(x0, x1, e1, e2, telemetria=None):
+    fun = f if telemetria is None else telemetria.contar(f)
+
+    if abs(fun(x0)) < e1:
         return x0
     
     if abs(x1) < e1 or abs(x1- x0) < e2:
@@ -12,10 +16,13 @@ def secante(x0, x1, e1, e2):
     k = 1
 
     while True:
-        x2 = x1 - (f(x1)/(f(x1) - f(x0))) * (x1 - x0)
+        x2 = x1 - (fun(x1)/(fun(x1) - fun(x0))) * (x1 - x0)
+
+        if telemetria is not None:
+            telemetria.registrar(k, x2)
 
         # Critério de parada: f(x2) < e1 ou x2-x1 < e2
-        if abs(f(x2)) < e1 or abs(x2 - x1) < e2:
+        if abs(fun(x2)) < e1 or abs(x2 - x1) < e2:
             return x2
         
         x0 = x1
@@ -31,4 +38,7 @@ e1, e2 = 1e-6, 1e-6
 x0 = 1.2
 x1 = 2.2
 
-print(secante(x0, x1, e1, e2))
+tel = Telemetria(capacidade=100)
+with tel:
+    print(secante(x0, x1, e1, e2, telemetria=tel))
+tel.imprimir()
@@ -0,0 +1,103 @@
+import math
+
+from telemetria import Telemetria
+
+def metodo_hibrido(f, a, b, e, max_aval=100, telemetria=None):
+    # Método de Brent: passos de secante ou de interpolação quadrática inversa enquanto
+    # ficarem dentro do intervalo, e bissecção quando não ficarem.
+    # Retorna a raíz e a quantidade de avaliações de f.
+    if telemetria is not None:
+        f = telemetria.contar(f)
+
+    fa = f(a)
+    fb = f(b)
+    aval = 2
+
+    # Regra do sinal: para existir raíz nesse intervalo, deve-se atender a esse critério
+    if fa * fb > 0:
+        raise ValueError("Nesse intervalo não existe raíz")
+    if fa == 0:
+        return a, aval
+    if fb == 0:
+        return b, aval
+
+    # b é sempre a melhor aproximação, c é o extremo oposto do intervalo [b, c]
+    c, fc = a, fa
+    d = b - a
+    passo_anterior = d
+
+    while aval < max_aval:
+        if fb * fc > 0:
+            c, fc = a, fa
+            d = b - a
+            passo_anterior = d
+
+        if abs(fc) < abs(fb):
+            a, b, c = b, c, b
+            fa, fb, fc = fb, fc, fb
+
+        tol = 2 * 2.2e-16 * abs(b) + e / 2
+        meio = (c - b) / 2
+
+        # Critério de parada: intervalo menor que a precisão ou raíz exata
+        if abs(meio) <= tol or fb == 0:
+            return b, aval
+
+        if abs(passo_anterior) >= tol and abs(fa) > abs(fb):
+            s = fb / fa
+            if a == c:
+                # Secante
+                p = 2 * meio * s
+                q = 1 - s
+            else:
+                # Interpolação quadrática inversa
+                q = fa / fc
+                r = fb / fc
+                p = s * (2 * meio * q * (q - r) - (b - a) * (r - 1))
+                q = (q - 1) * (r - 1) * (s - 1)
+
+            if p > 0:
+                q = -q
+            else:
+                p = -p
+
+            # O passo só é aceito se cair dentro do intervalo e reduzir o passo anterior pela metade
+            if 2 * p < min(3 * meio * q - abs(tol * q), abs(passo_anterior * q)):
+                passo_anterior = d
+                d = p / q
+            else:
+                d = meio
+                passo_anterior = d
+        else:
+            # Bissecção
+            d = meio
+            passo_anterior = d
+
+        a, fa = b, fb
+        if abs(d) > tol:
+            b += d
+        else:
+            b += math.copysign(tol, meio)
+
+        fb = f(b)
+        aval += 1
+
+        if telemetria is not None:
+            telemetria.registrar(aval - 2, b, fb)
+
+    print("Número máximo de avaliações atingido:", max_aval)
+    return b, aval
+
+# Exemplos:
+def f(x):
+    return math.e**(-x**2) - math.cos(x)
+
+print(metodo_hibrido(f, 1.2, 2.2, 1e-12))
+
+def g(x):
+    return x**3 - 3*x - 1
+
+tel = Telemetria(capacidade=100)
+with tel:
+    print(metodo_hibrido(g, -1, 0, 1e-12, telemetria=tel))
+tel.imprimir()
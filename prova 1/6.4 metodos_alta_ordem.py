@@ -0,0 +1,138 @@
+import cmath
+import math
+
+from telemetria import Telemetria
+
+def ordem_convergencia(x):
+    # Ordem de convergência computacional estimada com os quatro últimos iterados:
+    # p ≈ ln|d_k / d_{k-1}| / ln|d_{k-1} / d_{k-2}|, com d_k = x_{k+1} - x_k
+    if len(x) < 4:
+        return None
+    d2, d1, d0 = abs(x[-3] - x[-4]), abs(x[-2] - x[-3]), abs(x[-1] - x[-2])
+    if d0 == 0 or d1 == 0 or d2 == 0 or d1 == d2:
+        return None
+    return math.log(d0 / d1) / math.log(d1 / d2)
+
+def iterar(passo, x0, fx0, e1, e2, max_i, avaliacoes, telemetria=None):
+    # Laço comum a todos os métodos: passo(x, fx) devolve o novo x, f no novo x e
+    # quantas avaliações (de f e derivadas) foram usadas.
+    # Retorna a raíz, o número de iterações, o total de avaliações e a ordem estimada.
+    historico = [x0]
+    x, fx = x0, fx0
+
+    if telemetria is not None:
+        telemetria.avaliacoes += avaliacoes
+
+    # Verifica se o ponto inicial já é solução
+    if abs(fx) < e1:
+        return x, 0, avaliacoes, None
+
+    for k in range(1, max_i + 1):
+        x1, fx, aval = passo(x, fx)
+        avaliacoes += aval
+        historico.append(x1)
+
+        if telemetria is not None:
+            telemetria.avaliacoes += aval
+            telemetria.registrar(k, x1, fx)
+
+        # Critérios de parada: quando f(x1) < e1 ou x1 - x0 < e2
+        if abs(fx) < e1 or abs(x1 - x) < e2:
+            return x1, k, avaliacoes, ordem_convergencia(historico)
+
+        x = x1
+
+    print("Número máximo de iterações atingido:", max_i)
+    return x, max_i, avaliacoes, ordem_convergencia(historico)
+
+def halley(f, df, d2f, x0, e1, e2, max_i=100, telemetria=None):
+    # Método de Halley (ordem 3): usa f, f' e f''
+    def passo(x, fx):
+        d1, d2 = df(x), d2f(x)
+        denominador = 2*d1**2 - fx*d2
+        if denominador == 0:
+            raise ValueError("Denominador zero em x = {:.6f}. Método falhou.".format(x))
+        x1 = x - 2*fx*d1 / denominador
+        return x1, f(x1), 3
+
+    return iterar(passo, x0, f(x0), e1, e2, max_i, 1, telemetria)
+
+def king(f, df, x0, e1, e2, max_i=100, beta=0.0, telemetria=None):
+    # Família de King (ordem 4): um passo de Newton seguido de uma correção que só usa f;
+    # beta = 0 é o método de Ostrowski. Cada iteração usa f(x), f'(x) e f(y).
+    def passo(x, fx):
+        d1 = df(x)
+        if d1 == 0:
+            raise ValueError("A derivada é zero em x = {:.6f}. Método falhou.".format(x))
+        y = x - fx / d1
+        fy = f(y)
+        denominador = fx + (beta - 2)*fy
+        if denominador == 0:
+            return y, fy, 2
+        x1 = y - fy / d1 * (fx + beta*fy) / denominador
+        return x1, f(x1), 3
+
+    return iterar(passo, x0, f(x0), e1, e2, max_i, 1, telemetria)
+
+def ostrowski(f, df, x0, e1, e2, max_i=100, telemetria=None):
+    return king(f, df, x0, e1, e2, max_i, beta=0.0, telemetria=telemetria)
+
+def muller(f, x0, x1, x2, e1, e2, max_i=100, telemetria=None):
+    # Método de Muller (ordem ≈ 1.84): parábola pelos três últimos pontos, sem derivadas.
+    # Pode encontrar raízes complexas mesmo partindo de pontos reais.
+    pontos = [x0, x1]
+    valores = [f(x0), f(x1)]
+
+    def passo(x, fx):
+        a0, a1 = pontos
+        f0, f1 = valores
+        h1, h2 = a1 - a0, x - a1
+        d1, d2 = (f1 - f0) / h1, (fx - f1) / h2
+        a = (d2 - d1) / (h2 + h1)
+        b = a*h2 + d2
+        raiz = cmath.sqrt(b*b - 4*fx*a)
+        # Escolhe o sinal que dá o maior denominador (menor passo)
+        denominador = b + raiz if abs(b + raiz) > abs(b - raiz) else b - raiz
+        if denominador == 0:
+            raise ValueError("Denominador zero em x = {}. Método falhou.".format(x))
+        x_novo = x - 2*fx / denominador
+        if x_novo.imag == 0:
+            x_novo = x_novo.real
+
+        pontos[:] = [a1, x]
+        valores[:] = [f1, fx]
+        return x_novo, f(x_novo), 1
+
+    return iterar(passo, x2, f(x2), e1, e2, max_i, 3, telemetria)
+
+# Exemplo: x**3 - 3*x - 1 perto de x = 2
+def f(x):
+    return x**3 - 3*x - 1
+
+def df(x):
+    return 3*x**2 - 3
+
+def d2f(x):
+    return 6*x
+
+e1, e2 = 1e-14, 1e-14
+
+resultados = {
+    "Halley": halley(f, df, d2f, 2.5, e1, e2),
+    "Ostrowski": ostrowski(f, df, 2.5, e1, e2),
+    "King (beta=1)": king(f, df, 2.5, e1, e2, beta=1.0),
+    "Muller": muller(f, 3.0, 2.75, 2.5, e1, e2),
+}
+
+# Índice de eficiência p^(1/m): m é o número de avaliações por iteração
+for nome, (x, k, aval, ordem) in resultados.items():
+    print(f"{nome}: x = {x}, iterações = {k}, avaliações = {aval}, ordem estimada = {ordem}, "
+          f"eficiência = {ordem ** (k / aval)}")
+
+tel = Telemetria(capacidade=100)
+with tel:
+    halley(f, df, d2f, 2.5, e1, e2, telemetria=tel)
+tel.imprimir()
+
+# Muller encontra raízes complexas: x**2 + 1 = 0
+print(muller(lambda x: x**2 + 1, 0.0, 0.5, 1.0, e1, e2))
@@ -0,0 +1,131 @@
+import numpy as np
+
+def newton_para_monomial(coeficientes, x_tab):
+    # Converte os coeficientes da forma de Newton (FormaDeNewton) em coeficientes
+    # da base 1, x, x**2, ... (mesma ordem usada pela matriz de Vandermonde)
+    n = len(coeficientes)
+    p = np.zeros(n, dtype=complex if np.iscomplexobj(coeficientes) else float)
+    p[0] = coeficientes[n-1]
+
+    # Horner na forma de Newton: p(x) = c_{i} + (x - x_i) p(x)
+    for i in range(n - 2, -1, -1):
+        p[1:] = p[:-1].copy()
+        p[0] = 0
+        p[:-1] -= x_tab[i] * p[1:]
+        p[0] += coeficientes[i]
+
+    return p
+
+def horner(c, z):
+    # Avalia p(z) e p'(z) para um array de pontos z; c em ordem decrescente de grau
+    p = np.full_like(z, c[0])
+    dp = np.zeros_like(z)
+    for ci in c[1:]:
+        dp = dp*z + p
+        p = p*z + ci
+    return p, dp
+
+def aberth(c, tol, max_i):
+    # Método de Aberth-Ehrlich: todas as raízes melhoradas juntas, vetorizado
+    n = len(c) - 1
+
+    # Chutes iniciais num círculo com o raio da cota de Fujiwara (ângulo deslocado evita simetrias):
+    # |z| <= 2 max(|a_1/a_0|, |a_2/a_0|^(1/2), ..., |a_n/(2 a_0)|^(1/n)), bem mais justa que a de
+    # Cauchy (1 + max|a_k/a_0|), que com coeficientes grandes faz z**n estourar em horner
+    k = np.arange(1, n + 1)
+    razoes = np.abs(c[1:] / c[0])
+    razoes[-1] /= 2
+    raio = 2 * np.max(razoes ** (1 / k))
+    z = raio * np.exp(1j * (2*np.pi*np.arange(n)/n + 0.4))
+    ativos = np.ones(n, dtype=bool)
+
+    for k in range(max_i):
+        p, dp = horner(c, z[ativos])
+        razao = p / np.where(dp == 0, 1, dp)
+
+        diferencas = z[ativos, None] - z[None, :]
+        diferencas[np.arange(diferencas.shape[0]), np.flatnonzero(ativos)] = np.inf
+        soma = np.sum(1 / diferencas, axis=1)
+
+        w = razao / (1 - razao*soma)
+        z[ativos] -= w
+
+        # Raízes já convergidas ficam congeladas
+        ativos[np.flatnonzero(ativos)[np.abs(w) <= tol * np.maximum(np.abs(z[ativos]), 1)]] = False
+        if not ativos.any():
+            break
+
+    return z
+
+def companheira(c):
+    # Autovalores da matriz companheira do polinômio mônico
+    n = len(c) - 1
+    C = np.zeros((n, n), dtype=np.result_type(c, float))
+    C[0, :] = -c[1:] / c[0]
+    C[1:, :-1] = np.eye(n - 1)
+    return np.linalg.eigvals(C)
+
+def raizes_polinomio(coeficientes, crescente=True, metodo="aberth", tol=1e-14, max_i=500, polir=True):
+    # Todas as raízes (reais e complexas) de um polinômio.
+    # crescente=True: coeficientes de 1, x, x**2, ... (saída de Vandermonde / newton_para_monomial)
+    c = np.array(coeficientes)
+    c = c.astype(complex if np.iscomplexobj(c) else float)
+    if crescente:
+        c = c[::-1]
+
+    # Remove coeficientes líderes nulos (grau verdadeiro)
+    nao_nulos = np.flatnonzero(c)
+    if nao_nulos.size == 0:
+        raise ValueError("O polinômio é identicamente nulo.")
+    c = c[nao_nulos[0]:]
+
+    # Deflação das raízes nulas: p(x) = x**m q(x). As demais raízes não são deflacionadas:
+    # no Aberth cada raiz convergida fica congelada e continua repelindo as outras pela soma
+    # 1/(z_i - z_j), o que faz o papel da deflação sem perder precisão ao dividir q
+    m = len(c) - 1 - nao_nulos[-1] + nao_nulos[0]
+    q = c[:len(c) - m]
+
+    if len(q) == 1:
+        return np.zeros(m)
+
+    if metodo == "aberth":
+        z = aberth(q, tol, max_i)
+        # Se a iteração estourar (inf/NaN), usa os autovalores da matriz companheira
+        if not np.all(np.isfinite(z)):
+            z = companheira(q).astype(complex)
+    elif metodo == "companheira":
+        z = companheira(q).astype(complex)
+    else:
+        raise ValueError("Método não suportado.")
+
+    # Polimento: alguns passos de Newton no polinômio original
+    if polir:
+        for _ in range(3):
+            p, dp = horner(q.astype(complex), z)
+            seguro = dp != 0
+            z[seguro] -= p[seguro] / dp[seguro]
+
+    z = np.concatenate([z, np.zeros(m)])
+
+    # Raízes com parte imaginária desprezível são devolvidas como reais
+    reais = np.abs(z.imag) <= 1e3 * np.finfo(float).eps * np.maximum(np.abs(z), 1)
+    if reais.all():
+        z = z.real
+    else:
+        z[reais] = z[reais].real
+
+    return z[np.lexsort((z.imag, z.real))]
+
+# Exemplo: x**3 - 3*x - 1 (coeficientes em ordem crescente de grau)
+print(raizes_polinomio([-1, -3, 0, 1]))
+
+# x**3 - 9*x + 3 pelos autovalores da matriz companheira
+print(raizes_polinomio([3, -9, 0, 1], metodo="companheira"))
+
+# Raízes complexas e raíz nula: x**4 + x**2 = x**2 (x**2 + 1)
+print(raizes_polinomio([0, 0, 1, 0, 1]))
+
+# Polinômio interpolador na forma de Newton pelos pontos (-1, 0), (0, -1), (1, 0), (2, 3): x**2 - 1
+x_tab = np.array([-1., 0., 1., 2.])
+coeficientes = np.array([0., -1., 1., 0.])  # diferenças divididas
+print(raizes_polinomio(newton_para_monomial(coeficientes, x_tab)))
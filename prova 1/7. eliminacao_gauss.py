@@ -1,31 +1,51 @@
 # V V V
 
+from sistemas_banda import largura_banda
+
 def eliminacao(A, b):
     n = len(A)
 
+    # b pode ser um vetor ou uma matriz n x k (uma coluna por sistema)
+    vetor = not isinstance(b[0], (list, tuple))
+    B = [[bi] for bi in b] if vetor else b
+
+    # Sem pivoteamento não há preenchimento fora da banda: com p subdiagonais e
+    # q superdiagonais, só as linhas k+1..k+p e as colunas k..k+q precisam ser visitadas
+    p, q = largura_banda(A)
+
     # Eliminação para transformar a matriz em triangular superior
     for k in range(n):
-        for i in range(k+1, n):
+        for i in range(k+1, min(n, k+p+1)):
             if A[k][k] == 0:
                 raise ValueError("Matriz singular, não é possível continuar.")
             m = A[i][k] / A[k][k]
-            for j in range(k, n):
+            for j in range(k, min(n, k+q+1)):
                 A[i][j] -= m * A[k][j]
-            b[i] -= m * b[k]
-    
+            # O mesmo multiplicador é aplicado a todas as colunas de B de uma vez
+            B[i] = [bij - m * bkj for bij, bkj in zip(B[i], B[k])]
+
+    if vetor:
+        b[:] = [linha[0] for linha in B]
+
     return A, b
 
 def resolucao_sistema(A, b):
     n = len(A)
-    x = [0] * n
+    p, q = largura_banda(A)
 
-    x[n-1] = b[n-1] / A[n-1][n-1]
+    vetor = not isinstance(b[0], (list, tuple))
+    B = [[bi] for bi in b] if vetor else b
+    x = [None] * n
+
+    x[n-1] = [bj / A[n-1][n-1] for bj in B[n-1]]
     for k in range(n-2, -1, -1):
-        s = 0
-        for j in range(k+1, n):
-            s += A[k][j] * x[j]
-        x[k] = (b[k] - s) / A[k][k]
+        s = [0] * len(B[k])
+        for j in range(k+1, min(n, k+q+1)):
+            s = [sc + A[k][j] * xc for sc, xc in zip(s, x[j])]
+        x[k] = [(bc - sc) / A[k][k] for bc, sc in zip(B[k], s)]
 
+    if vetor:
+        return [linha[0] for linha in x]
     return x
 
 # Exemplo:
@@ -45,3 +65,24 @@ A, b = eliminacao(A, b)
 x = resolucao_sistema(A, b)
 
 print(x)
+
+
+# Vários sistemas com a mesma matriz: cada coluna de B é um vetor de termos independentes
+A = [
+    [1, 1, 0, 3],
+    [2, 1, -1, 1],
+    [3, -1, -1, 2],
+    [-1, 2, 3, -1]
+]
+
+B = [
+    [4, 1],
+    [1, 0],
+    [-3, 0],
+    [4, 0]
+]
+
+A, B = eliminacao(A, B)
+X = resolucao_sistema(A, B)
+
+print(X)
\ No newline at end of file
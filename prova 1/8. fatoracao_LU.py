@@ -1,6 +1,10 @@
 # V
 
-def fatoracao_LU(A, b):
+from cache_fatoracao import CacheFatoracoes
+from sistemas_banda import FatoracaoBanda, largura_banda, resolver_banda
+from sistemas_simetricos import FatoracaoCholesky, eh_simetrica
+
+def decompor_LU(A):
     n = len(A)
 
     # Verificação se a matriz é quadrada
@@ -23,6 +27,11 @@ def fatoracao_LU(A, b):
             else:
                 L[j][i] = (A[j][i] - sum(L[j][k] * U[k][i] for k in range(i))) / U[i][i]
 
+    return L, U
+
+def substituicoes_LU(L, U, b):
+    n = len(L)
+
     # Substituição para frente: Resolver Ly = b
     y = [0] * n
     for i in range(n):
@@ -35,7 +44,42 @@ def fatoracao_LU(A, b):
             raise ValueError("Sistema não tem solução única (divisão por zero detectada).")
         x[i] = (y[i] - sum(U[i][j] * x[j] for j in range(i + 1, n))) / U[i][i]
 
-    return x  # Retorna o vetor solução
+    return x
+
+def tentar_cholesky(A):
+    # FatoracaoCholesky de A, ou None se A não for positiva definida
+    try:
+        return FatoracaoCholesky(A)
+    except ValueError:
+        return None
+
+def fatoracao_LU(A, b, cache=None):
+    # Com um CacheFatoracoes, uma matriz já fatorada pula direto para as substituições
+
+    # Matriz em banda estreita (tridiagonal, pentadiagonal, ...): fatoração em banda, O(n·bw²)
+    p, q = largura_banda(A)
+    if 4 * (2*p + q + 1) <= len(A):
+        if cache is None:
+            return resolver_banda(A, b).tolist()
+        return cache.obter(A, lambda A: FatoracaoBanda(A, p, q), tipo="banda").resolver(b).tolist()
+
+    # Matriz simétrica: tenta Cholesky (metade das operações e da memória da LU);
+    # se não for positiva definida, segue para a LU geral. No cache, a tentativa que
+    # falhou fica guardada como None, para não ser repetida a cada chamada.
+    if eh_simetrica(A):
+        if cache is None:
+            cholesky = tentar_cholesky(A)
+        else:
+            cholesky = cache.obter(A, tentar_cholesky, tamanho=lambda F: 0 if F is None else F.nbytes)
+        if cholesky is not None:
+            return cholesky.resolver(b).tolist()
+
+    if cache is None:
+        L, U = decompor_LU(A)
+    else:
+        L, U = cache.obter(A, decompor_LU, tamanho=lambda LU: 2 * 8 * len(A)**2)
+
+    return substituicoes_LU(L, U, b)  # Retorna o vetor solução
 
 # Exemplo:
 A = [
@@ -46,3 +90,31 @@ b = [10, 12]
 
 x = fatoracao_LU(A, b)
 print("Solução:", x)
+
+# Mesma matriz, vários vetores b: só a primeira chamada fatora
+cache = CacheFatoracoes()
+for b in [[10, 12], [1, 0], [0, 1]]:
+    print("Solução:", fatoracao_LU(A, b, cache))
+print(cache.estatisticas())
+
+# Sistema tridiagonal grande: vai direto para o algoritmo de Thomas
+n = 1000
+A = [[2 if i == j else -1 if abs(i - j) == 1 else 0 for j in range(n)] for i in range(n)]
+b = [1] + [0] * (n - 2) + [1]
+x = fatoracao_LU(A, b)
+print("Erro máximo:", max(abs(xi - 1) for xi in x))
+
+# Matriz simétrica positiva definida: resolvida por Cholesky
+A = [[4, 2, 2],
+     [2, 5, 3],
+     [2, 3, 6]]
+print("Solução:", fatoracao_LU(A, [8, 10, 11]))
+
+# Simétrica mas indefinida: Cholesky falha uma vez só e a LU geral fica no cache
+cache = CacheFatoracoes()
+A = [[1, 2, 3],
+     [2, -4, 1],
+     [3, 1, 2]]
+for _ in range(2):
+    print("Solução:", fatoracao_LU(A, [6, -1, 6], cache))
+print(cache.estatisticas())
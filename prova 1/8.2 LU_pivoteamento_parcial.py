@@ -1,6 +1,14 @@
 # V
 
-def lu_decomposition_with_pivoting(A, b):
+import numpy as np
+
+from cache_fatoracao import CacheFatoracoes
+
+def lu_decomposition_with_pivoting(A, b, cache=None):
+    # Com um CacheFatoracoes, a fatoração (FatoracaoLU) de uma matriz repetida é reaproveitada
+    if cache is not None:
+        return cache.obter(A, FatoracaoLU).resolver(b).tolist()
+
     n = len(A)
 
     # Inicialização dos vetores
@@ -55,6 +63,72 @@ def lu_decomposition_with_pivoting(A, b):
 
     return x
 
+class FatoracaoLU:
+    # Guarda a fatoração PA = LU (L e U compactados na mesma matriz, como em
+    # lu_decomposition_with_pivoting) para resolver vários sistemas com a mesma A.
+    # A fatoração é feita por blocos de colunas: o painel é fatorado coluna a coluna
+    # e o resto da matriz recebe uma única atualização de posto "bloco" (produto de matrizes).
+
+    def __init__(self, A, bloco=64):
+        LU = np.array(A, dtype=float)
+        n = LU.shape[0]
+        if LU.ndim != 2 or LU.shape[1] != n:
+            raise ValueError("A matriz deve ser quadrada")
+
+        p = np.arange(n)
+
+        for k0 in range(0, n, bloco):
+            k1 = min(k0 + bloco, n)
+
+            # Fatoração do painel LU[k0:, k0:k1] com pivoteamento parcial
+            for k in range(k0, k1):
+                r = k + np.argmax(np.abs(LU[k:, k]))
+                if LU[r, k] == 0:
+                    raise ValueError("A matriz A é singular.")
+
+                # Troca as linhas inteiras (inclusive as já fatoradas e as ainda não atualizadas)
+                if r != k:
+                    LU[[k, r]] = LU[[r, k]]
+                    p[[k, r]] = p[[r, k]]
+
+                LU[k+1:, k] /= LU[k, k]
+                LU[k+1:, k+1:k1] -= np.outer(LU[k+1:, k], LU[k, k+1:k1])
+
+            if k1 < n:
+                # U12 = L11^-1 A12 (substituição direta com L11 unitária)
+                for k in range(k0, k1):
+                    LU[k+1:k1, k1:] -= np.outer(LU[k+1:k1, k], LU[k, k1:])
+
+                # Atualização de posto bloco do complemento de Schur: A22 -= L21 U12
+                LU[k1:, k1:] -= LU[k1:, k0:k1] @ LU[k0:k1, k1:]
+
+        self.LU = LU
+        self.p = p
+
+    @property
+    def nbytes(self):
+        return self.LU.nbytes + self.p.nbytes
+
+    def resolver(self, b):
+        # Resolve Ax = b em O(n²) usando os fatores guardados; b pode ter várias colunas (n x k)
+        LU = self.LU
+        n = LU.shape[0]
+
+        # Substituição de Pb
+        y = np.array(b, dtype=float)[self.p]
+
+        # Substituição direta Ly = c
+        for i in range(1, n):
+            y[i] -= LU[i, :i] @ y[:i]
+
+        # Substituição retroativa Ux = y
+        for i in range(n - 1, -1, -1):
+            y[i] = (y[i] - LU[i, i+1:] @ y[i+1:]) / LU[i, i]
+
+        return y
+
+    solve = resolver
+
 # Exemplo de uso:
 A = [[2, -1, -2],
      [-4, 6, 3],
@@ -63,3 +137,20 @@ b = [1, 2, 3]
 
 x = lu_decomposition_with_pivoting(A, b)
 print("Solução:", x)
+
+
+# Fatorando uma vez e resolvendo para vários vetores b:
+fatoracao = FatoracaoLU([[2, -1, -2],
+                         [-4, 6, 3],
+                         [-4, -2, 8]])
+print("Solução:", fatoracao.resolver([1, 2, 3]))
+print("Várias soluções:", fatoracao.resolver(np.array([[1, 0], [2, 1], [3, 0]])))
+
+# Com cache: a mesma matriz só é fatorada uma vez
+cache = CacheFatoracoes()
+A = [[2, -1, -2],
+     [-4, 6, 3],
+     [-4, -2, 8]]
+for b in [[1, 2, 3], [1, 0, 0], [0, 1, 0]]:
+    print("Solução:", lu_decomposition_with_pivoting(A, b, cache))
+print(cache.estatisticas())
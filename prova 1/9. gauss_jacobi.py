@@ -1,5 +1,9 @@
 # V
 
+import numpy as np
+
+from matriz_esparsa import MatrizCSR
+
 def gauss_jacobi(A, b, e, max_i):
     n = len(b)
     x = [0.0] * n
@@ -26,6 +30,66 @@ def gauss_jacobi(A, b, e, max_i):
     print("Número máximo de iterações atingido:", max_i)
     return x_novo
 
+def gauss_jacobi_vetorizado(A, b, e, max_i, residuo=None):
+    # x_novo = D^-1 (b - R x), com R = A sem a diagonal, num único produto matriz-vetor.
+    # Dois vetores pré-alocados se alternam (sem cópias por iteração).
+    # Se residuo for dado, também para quando ||b - Ax|| / ||b|| < residuo.
+    R = np.array(A, dtype=float)
+    b = np.asarray(b, dtype=float)
+    d = R.diagonal().copy()
+    if np.any(d == 0):
+        raise ValueError("A diagonal da matriz tem elemento nulo.")
+    np.fill_diagonal(R, 0)
+
+    n = len(b)
+    x = np.zeros(n)
+    x_novo = np.zeros(n)
+    aux = np.empty(n)
+    norma_b = np.linalg.norm(b)
+
+    for k in range(max_i):
+        np.dot(R, x, out=aux)
+        np.subtract(b, aux, out=x_novo)
+        x_novo /= d
+
+        np.subtract(x_novo, x, out=aux)
+
+        # O resíduo de x sai de graça: b - Ax = D (x_novo - x)
+        if residuo is not None and np.linalg.norm(d * aux) < residuo * norma_b:
+            return x_novo
+
+        np.abs(aux, out=aux)
+        e_total = aux.sum()
+        if e_total < e:
+            return x_novo
+
+        x, x_novo = x_novo, x
+
+    print("Número máximo de iterações atingido:", max_i)
+    return x
+
+def gauss_jacobi_esparso(A, b, e, max_i):
+    # A é uma MatrizCSR: cada iteração percorre só os elementos não nulos, O(nnz)
+    b = np.asarray(b, dtype=float)
+    d = A.diagonal()
+    if np.any(d == 0):
+        raise ValueError("A diagonal da matriz tem elemento nulo.")
+
+    x = np.zeros(len(b))
+
+    for k in range(max_i):
+        # x_novo[i] = (b[i] - soma dos a_ij x_j com j != i) / a_ii
+        x_novo = (b - (A @ x - d * x)) / d
+
+        e_total = np.sum(np.abs(x_novo - x))
+        if e_total < e:
+            return x_novo
+
+        x = x_novo
+
+    print("Número máximo de iterações atingido:", max_i)
+    return x_novo
+
 # Exemplo:
 A = [[10, 2, 1],
      [1, 5, 1],
@@ -37,3 +101,19 @@ max_i = 100
 
 resultado = gauss_jacobi(A, b, e, max_i)
 print("Solução:", resultado)
+
+resultado = gauss_jacobi_vetorizado(A, b, e, max_i, residuo=1e-10)
+print("Solução (vetorizada):", resultado)
+
+# Exemplo esparso: sistema tridiagonal com 100000 incógnitas
+n = 100000
+i = np.arange(n)
+A_esparsa = MatrizCSR.de_coordenadas(
+    np.concatenate([i, i[1:], i[:-1]]),
+    np.concatenate([i, i[:-1], i[1:]]),
+    np.concatenate([np.full(n, 4.0), np.full(n - 1, -1.0), np.full(n - 1, -1.0)]),
+    (n, n))
+b_esparso = A_esparsa @ np.ones(n)
+
+resultado = gauss_jacobi_esparso(A_esparsa, b_esparso, e, max_i)
+print("Erro máximo:", np.max(np.abs(resultado - 1)))
\ No newline at end of file
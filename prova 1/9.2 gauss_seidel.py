@@ -1,19 +1,51 @@
 # V
 
-def gauss_seidel(A, b, e, max_i):
+import numpy as np
+
+from matriz_esparsa import MatrizCSR
+
+def omega_otimo(razao, w, simetrico=False):
+    # Estimativa do ω ótimo a partir da taxa de convergência λ observada com o ω atual.
+    # Para matrizes consistentemente ordenadas (Poisson, tridiagonais, ...) o raio espectral
+    # de Jacobi satisfaz ρ_J² = (λ + ω - 1)² / (ω² λ), e o ω ótimo do SOR é
+    # 2 / (1 + sqrt(1 - ρ_J²)). Para o SSOR usa-se 2 / (1 + sqrt(2 (1 - ρ_J))).
+    # Com ω acima do ótimo a taxa fica em ω - 1 e a relação deixa de valer
+    if not w - 1 < razao < 1:
+        return w
+    rho_j2 = min((razao + w - 1)**2 / (w**2 * razao), 1.0)
+    if simetrico:
+        return 2 / (1 + (2 * (1 - rho_j2 ** 0.5)) ** 0.5)
+    return 2 / (1 + (1 - rho_j2) ** 0.5)
+
+def ajustar_omega(razoes, w, simetrico):
+    # Quando a razão entre erros sucessivos se estabiliza, devolve o novo ω; senão None
+    if len(razoes) >= 5 and abs(razoes[-1] - razoes[-2]) < 1e-4 * razoes[-1] or len(razoes) >= 50:
+        return omega_otimo(razoes[-1], w, simetrico)
+    return None
+
+def gauss_seidel(A, b, e, max_i, omega=1.0, simetrico=False):
+    # omega: fator de relaxação (SOR); omega="auto" estima o ω ótimo nas primeiras iterações
+    # simetrico=True: cada iteração faz uma varredura para frente e outra para trás (SSOR)
     n = len(b)
     x = [0.0] * n
 
+    estimar = omega == "auto"
+    w = 1.0 if estimar else omega
+    razoes = []
+    e_anterior = None
+    ordens = [range(n), range(n - 1, -1, -1)] if simetrico else [range(n)]
+
     for k in range(max_i):
         x_novo = x[:]
 
-        for i in range(n):
-            soma = b[i]
+        for ordem in ordens:
+            for i in ordem:
+                soma = b[i]
 
-            for j in range(n):
-                if i != j:
-                    soma -= A[i][j] * x_novo[j]
-            x_novo[i] = soma / A[i][i]
+                for j in range(n):
+                    if i != j:
+                        soma -= A[i][j] * x_novo[j]
+                x_novo[i] = (1 - w) * x_novo[i] + w * soma / A[i][i]
 
         e_total = 0.0
         for i in range(n):
@@ -21,12 +53,74 @@ def gauss_seidel(A, b, e, max_i):
 
         if e_total < e:
             return x_novo
+
+        # ω é aumentado aos poucos, sempre a partir da taxa observada com o ω atual;
+        # no SSOR a relação entre as taxas só vale para ω = 1, então a estimativa é única
+        if estimar and e_anterior:
+            razoes.append(e_total / e_anterior)
+            w_estimado = ajustar_omega(razoes, w, simetrico)
+            if w_estimado is not None:
+                estimar = w_estimado > w + 1e-3 and not simetrico
+                w = max(w, w_estimado)
+                razoes = []
+        e_anterior = e_total
         
         x = x_novo[:]  # Atualiza o vetor x com x_novo
 
     print("Número máximo de iterações atingido:", max_i)
     return x_novo
 
+def gauss_seidel_esparso(A, b, e, max_i, omega=1.0, simetrico=False):
+    # A é uma MatrizCSR: cada iteração percorre só os elementos não nulos, O(nnz)
+    n = len(b)
+    dados = A.dados.tolist()
+    indices = A.indices.tolist()
+    ponteiros = A.ponteiros.tolist()
+    d = A.diagonal().tolist()
+    if 0 in d:
+        raise ValueError("A diagonal da matriz tem elemento nulo.")
+
+    b = list(b)
+    x = [0.0] * n
+
+    estimar = omega == "auto"
+    w = 1.0 if estimar else omega
+    razoes = []
+    e_anterior = None
+    ordens = [range(n), range(n - 1, -1, -1)] if simetrico else [range(n)]
+
+    for k in range(max_i):
+        e_total = 0.0
+
+        # x é atualizado no lugar: os valores novos já são usados nas linhas seguintes
+        for ordem in ordens:
+            for i in ordem:
+                soma = b[i]
+                for p in range(ponteiros[i], ponteiros[i + 1]):
+                    j = indices[p]
+                    if j != i:
+                        soma -= dados[p] * x[j]
+                x_novo_i = (1 - w) * x[i] + w * soma / d[i]
+                e_total += abs(x_novo_i - x[i])
+                x[i] = x_novo_i
+
+        if e_total < e:
+            return x
+
+        # ω é aumentado aos poucos, sempre a partir da taxa observada com o ω atual;
+        # no SSOR a relação entre as taxas só vale para ω = 1, então a estimativa é única
+        if estimar and e_anterior:
+            razoes.append(e_total / e_anterior)
+            w_estimado = ajustar_omega(razoes, w, simetrico)
+            if w_estimado is not None:
+                estimar = w_estimado > w + 1e-3 and not simetrico
+                w = max(w, w_estimado)
+                razoes = []
+        e_anterior = e_total
+
+    print("Número máximo de iterações atingido:", max_i)
+    return x
+
 # Exemplo: 
 A = [
     [10, 2, 1],
@@ -39,4 +133,27 @@ e = 1e-6
 max_i = 100
 
 resultado = gauss_seidel(A, b, e, max_i)
-print("Solução: ", resultado)
\ No newline at end of file
+print("Solução: ", resultado)
+
+# Exemplo de Poisson 1D (-x[i-1] + 2x[i] - x[i+1] = h²): mesmo número de iterações, erros bem diferentes
+m = 40
+A_poisson = [[2 if i == j else -1 if abs(i - j) == 1 else 0 for j in range(m)] for i in range(m)]
+b_poisson = [1 / (m + 1)**2] * m
+exata = [(i + 1) / (m + 1) * (1 - (i + 1) / (m + 1)) / 2 for i in range(m)]
+
+for nome, opcoes in [("Gauss-Seidel", {}), ("SOR", {"omega": "auto"}), ("SSOR", {"omega": "auto", "simetrico": True})]:
+    x = gauss_seidel(A_poisson, b_poisson, 1e-12, 200, **opcoes)
+    print(nome, "erro máximo:", max(abs(xi - ei) for xi, ei in zip(x, exata)))
+
+# Exemplo esparso: sistema tridiagonal com 100000 incógnitas
+n = 100000
+i = np.arange(n)
+A_esparsa = MatrizCSR.de_coordenadas(
+    np.concatenate([i, i[1:], i[:-1]]),
+    np.concatenate([i, i[:-1], i[1:]]),
+    np.concatenate([np.full(n, 4.0), np.full(n - 1, -1.0), np.full(n - 1, -1.0)]),
+    (n, n))
+b_esparso = A_esparsa @ np.ones(n)
+
+resultado = gauss_seidel_esparso(A_esparsa, b_esparso, e, max_i)
+print("Erro máximo:", max(abs(xi - 1) for xi in resultado))
\ No newline at end of file
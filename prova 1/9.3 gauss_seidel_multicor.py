@@ -0,0 +1,144 @@
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+from matriz_esparsa import MatrizCSR
+
+# Gauss-Seidel com ordenação por cores: incógnitas da mesma cor não aparecem umas nas
+# equações das outras, então todas as da mesma cor podem ser atualizadas juntas (em bloco
+# vetorizado ou em paralelo), e cada cor já usa os valores novos das cores anteriores.
+
+def colorir_vermelho_preto(nx, ny):
+    # Grade nx x ny numerada por linhas (i = linha*nx + coluna), estêncil de 5 pontos:
+    # vermelho quando linha + coluna é par, preto quando é ímpar
+    linha, coluna = np.divmod(np.arange(nx * ny), nx)
+    paridade = (linha + coluna) % 2
+    return [np.flatnonzero(paridade == 0), np.flatnonzero(paridade == 1)]
+
+def colorir_guloso(A):
+    # Coloração gulosa do grafo de A (i e j vizinhos quando a_ij != 0 ou a_ji != 0)
+    n = A.forma[0]
+    linhas = A.linhas()
+    fora = linhas != A.indices
+    vizinhos = MatrizCSR.de_coordenadas(
+        np.concatenate([linhas[fora], A.indices[fora]]),
+        np.concatenate([A.indices[fora], linhas[fora]]),
+        np.ones(2 * np.count_nonzero(fora)), (n, n))
+
+    indices = vizinhos.indices.tolist()
+    ponteiros = vizinhos.ponteiros.tolist()
+    cor = [-1] * n
+
+    for i in range(n):
+        usadas = {cor[j] for j in indices[ponteiros[i]:ponteiros[i + 1]]}
+        c = 0
+        while c in usadas:
+            c += 1
+        cor[i] = c
+
+    cor = np.array(cor)
+    return [np.flatnonzero(cor == c) for c in range(cor.max() + 1)]
+
+def atualizar_bloco(x, b, bloco):
+    # Atualiza de uma vez todas as incógnitas de um bloco da mesma cor; devolve a soma de |Δx|
+    idx, A_bloco, d = bloco
+    x_antigo = x[idx]
+    x_novo = (b[idx] - (A_bloco @ x - d * x_antigo)) / d
+    x[idx] = x_novo
+    return np.sum(np.abs(x_novo - x_antigo))
+
+def preparar_blocos(A, cores, partes):
+    # Para cada cor, divide as linhas em "partes" blocos e guarda a submatriz e a diagonal de cada um
+    d = A.diagonal()
+    if np.any(d == 0):
+        raise ValueError("A diagonal da matriz tem elemento nulo.")
+
+    blocos = []
+    for idx in cores:
+        blocos.append([(parte, A.submatriz_linhas(parte), d[parte])
+                       for parte in np.array_split(idx, partes) if len(parte)])
+    return blocos
+
+# Estado de cada processo trabalhador (preenchido uma vez, na criação do processo)
+_estado = {}
+
+def _iniciar_trabalhador(nome, n, b, blocos):
+    memoria = shared_memory.SharedMemory(name=nome)
+    _estado["memoria"] = memoria
+    _estado["x"] = np.ndarray((n,), dtype=float, buffer=memoria.buf)
+    _estado["b"] = b
+    _estado["blocos"] = blocos
+
+def _atualizar_no_trabalhador(cor, parte):
+    return atualizar_bloco(_estado["x"], _estado["b"], _estado["blocos"][cor][parte])
+
+def gauss_seidel_multicor(A, b, e, max_i, cores=None, processos=1):
+    # A é uma MatrizCSR; cores é a lista de índices de cada cor (padrão: coloração gulosa).
+    # Com processos > 1, cada cor é dividida entre processos que escrevem no mesmo vetor x
+    # em memória compartilhada; o fim de cada cor funciona como barreira de sincronização.
+    b = np.asarray(b, dtype=float)
+    n = len(b)
+    if cores is None:
+        cores = colorir_guloso(A)
+
+    if processos == 1:
+        blocos = preparar_blocos(A, cores, 1)
+        x = np.zeros(n)
+        for k in range(max_i):
+            e_total = sum(atualizar_bloco(x, b, bloco) for blocos_cor in blocos for bloco in blocos_cor)
+            if e_total < e:
+                return x
+        print("Número máximo de iterações atingido:", max_i)
+        return x
+
+    blocos = preparar_blocos(A, cores, processos)
+    memoria = shared_memory.SharedMemory(create=True, size=n * 8)
+    try:
+        x = np.ndarray((n,), dtype=float, buffer=memoria.buf)
+        x[:] = 0
+
+        with ProcessPoolExecutor(processos, initializer=_iniciar_trabalhador,
+                                 initargs=(memoria.name, n, b, blocos)) as executor:
+            for k in range(max_i):
+                e_total = 0.0
+                for cor, blocos_cor in enumerate(blocos):
+                    tarefas = [executor.submit(_atualizar_no_trabalhador, cor, parte)
+                               for parte in range(len(blocos_cor))]
+                    e_total += sum(tarefa.result() for tarefa in tarefas)
+
+                if e_total < e:
+                    return x.copy()
+
+        print("Número máximo de iterações atingido:", max_i)
+        return x.copy()
+    finally:
+        memoria.close()
+        memoria.unlink()
+
+def poisson_2d(nx, ny):
+    # Matriz do estêncil de 5 pontos (4 na diagonal, -1 nos vizinhos) numa grade nx x ny
+    linha, coluna = np.divmod(np.arange(nx * ny), nx)
+    i, j = [np.arange(nx * ny)], [np.arange(nx * ny)]
+    for dl, dc in [(0, 1), (0, -1), (1, 0), (-1, 0)]:
+        dentro = (0 <= linha + dl) & (linha + dl < ny) & (0 <= coluna + dc) & (coluna + dc < nx)
+        i.append(np.flatnonzero(dentro))
+        j.append((linha + dl)[dentro] * nx + (coluna + dc)[dentro])
+    valores = np.concatenate([np.full(nx * ny, 4.0)] + [np.full(len(v), -1.0) for v in i[1:]])
+    return MatrizCSR.de_coordenadas(np.concatenate(i), np.concatenate(j), valores, (nx * ny, nx * ny))
+
+if __name__ == "__main__":
+    # Exemplo: Poisson 2D numa grade 30 x 30, solução exata igual a 1
+    nx = ny = 30
+    A = poisson_2d(nx, ny)
+    b = A @ np.ones(nx * ny)
+    e = 1e-6
+    max_i = 5000
+
+    x = gauss_seidel_multicor(A, b, e, max_i, cores=colorir_vermelho_preto(nx, ny))
+    print("Vermelho-preto, erro máximo:", np.max(np.abs(x - 1)))
+
+    x = gauss_seidel_multicor(A, b, e, max_i)
+    print("Coloração gulosa, erro máximo:", np.max(np.abs(x - 1)))
+
+    x = gauss_seidel_multicor(A, b, e, max_i, cores=colorir_vermelho_preto(nx, ny), processos=4)
+    print("4 processos, erro máximo:", np.max(np.abs(x - 1)))
@@ -1,15 +1,22 @@
 import math
+import numpy as np
 
+from telemetria import Telemetria
 
 
-def bisseccao(f, a, b, e):
+
+def bisseccao(f, a, b, e, telemetria=None):
+    if telemetria is not None:
+        f = telemetria.contar(f)
+
     i=0
     ai=a
     bi=b
 
     while abs(bi-ai) > e:
         pi = (ai+bi)/2
-        print("a{}: {};  b{}: {};  p{}: {};".format(i,ai,i,bi,i,pi))
+        if telemetria is not None:
+            telemetria.registrar(i, pi, a=ai, b=bi)
         if f(ai)*f(pi)<0:
             bi = pi
         else:
@@ -19,9 +26,121 @@ def bisseccao(f, a, b, e):
     return (ai+bi)/2
 
 
-bisseccao(lambda x:x**3-9*x+3, -4,-2, 0.000000001)
-bisseccao(lambda x:x**3-9*x+3, 0,2, 0.000000001)
-bisseccao(lambda x:x**3-9*x+3, 2,4, 0.000000001)
-bisseccao(lambda x:math.sqrt(x)-5*math.exp(-x), 1,2, 0.000000001)
+def posicao_falsa(f, a, b, e1, e2, max_i=100, telemetria=None):
+    # Com a modificação de Illinois: quando o mesmo extremo fica parado duas vezes seguidas,
+    # o seu f é dividido por 2, senão esse extremo nunca sai do lugar e b - a não diminui
+    if telemetria is not None:
+        f = telemetria.contar(f)
+
+    fa=f(a)
+    fb=f(b)
+    parado = None  # extremo que ficou parado na iteração anterior
+
+    for k in range(max_i):
+        if abs(b-a) <= e1:
+            return (a+b)/2
+        x = (a*fb - b*fa)/(fb - fa)
+        fx = f(x)
+        if telemetria is not None:
+            telemetria.registrar(k, x, fx, a, b)
+        if abs(fx) < e2:
+            return x
+        if fa*fx<0:
+            b, fb = x, fx
+            if parado == "a":
+                fa /= 2
+            parado = "a"
+        else:
+            a, fa = x, fx
+            if parado == "b":
+                fb /= 2
+            parado = "b"
+
+    if abs(b-a) > e1:
+        print("Número máximo de iterações atingido:", max_i)
+    return (a+b)/2
+
+
+def _avaliar(f, x):
+    # Avalia f na grade inteira de uma vez; se f não aceitar arrays (math.sqrt, ...), avalia ponto a ponto
+    try:
+        y = np.asarray(f(x), dtype=float)
+        if y.shape == x.shape:
+            return y
+    except (TypeError, ValueError):
+        pass
+    return np.array([f(xi) for xi in x], dtype=float)
+
+
+def _varrer(f, x, y, nivel, subdivisoes):
+    s = np.sign(y)
+
+    # Subintervalos com troca de sinal
+    troca = s[:-1]*s[1:] < 0
+    refinar = troca.copy()
+
+    # Quase tangência: mínimo local de |f| sem troca de sinal, pode esconder duas raízes próximas
+    if len(y) >= 3:
+        ay = np.abs(y)
+        minimo = (s[:-2] == s[1:-1]) & (s[1:-1] == s[2:]) & (s[1:-1] != 0) & (ay[1:-1] < ay[:-2]) & (ay[1:-1] <= ay[2:])
+        j = np.flatnonzero(minimo) + 1
+        refinar[j-1] = True
+        refinar[j] = True
+
+    # Raízes exatas nos pontos internos da grade
+    zero = np.zeros(len(x)-1, dtype=bool)
+    zero[1:] = s[1:-1] == 0
+
+    for i in np.flatnonzero(refinar | zero):
+        if zero[i]:
+            yield float(x[i]), float(x[i])
+        if not refinar[i]:
+            continue
+        if nivel > 0:
+            # Grade mais fina dentro do subintervalo, reaproveitando os extremos já avaliados
+            xs = np.linspace(x[i], x[i+1], subdivisoes+1)
+            ys = np.empty_like(xs)
+            ys[0], ys[-1] = y[i], y[i+1]
+            ys[1:-1] = _avaliar(f, xs[1:-1])
+            yield from _varrer(f, xs, ys, nivel-1, subdivisoes)
+        elif troca[i]:
+            yield float(x[i]), float(x[i+1])
+
+
+def isolar_raizes(f, a, b, n=1000, refinamentos=3, subdivisoes=10):
+    # Gera, em ordem, intervalos disjuntos [ai, bi] com troca de sinal de f (ai == bi quando a raíz é exata)
+    x = np.linspace(a, b, n+1)
+    y = _avaliar(f, x)
+
+    if y[0] == 0:
+        yield float(x[0]), float(x[0])
+    yield from _varrer(f, x, y, refinamentos, subdivisoes)
+    if y[-1] == 0:
+        yield float(x[-1]), float(x[-1])
+
+
+def todas_raizes(f, a, b, e, metodo="bisseccao", telemetria=None, **opcoes):
+    # Encontra todas as raízes em [a, b] sem precisar escolher os intervalos manualmente
+    if metodo == "bisseccao":
+        resolver = lambda ai, bi: bisseccao(f, ai, bi, e, telemetria)
+    elif metodo == "posicao_falsa":
+        resolver = lambda ai, bi: posicao_falsa(f, ai, bi, e, e, telemetria=telemetria)
+    else:
+        raise ValueError("Método não suportado.")
+
+    raizes = []
+    for ai, bi in isolar_raizes(f, a, b, **opcoes):
+        raizes.append(ai if ai == bi else resolver(ai, bi))
+
+    return raizes
+
+
+print(todas_raizes(lambda x:x**3-9*x+3, -10,10, 0.000000001))
+print(todas_raizes(lambda x:x**3-9*x+3, -10,10, 0.000000001, metodo="posicao_falsa"))
+
+tel = Telemetria(capacidade=100)
+with tel:
+    print(bisseccao(lambda x:math.sqrt(x)-5*math.exp(-x), 1,2, 0.000000001, tel))
+tel.imprimir()
 # bisseccao(lambda x:x*math.log10(x)-1, 2,3, 0.00000000001)
 
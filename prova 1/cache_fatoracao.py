@@ -0,0 +1,95 @@
+# Cache de fatorações (LU, ...) indexado por uma impressão digital da matriz.
+#
+# A chave é o tipo de fatoração junto com um hash rápido (BLAKE2b) dos bytes da matriz em
+# float64 e da sua forma: a mesma matriz de coeficientes chegando de novo pula direto para
+# as substituições, e fatorações diferentes da mesma matriz (LU, Cholesky, ...) não colidem.
+# O espaço é limitado em bytes; quando passa do limite, as fatorações usadas há mais
+# tempo são descartadas (LRU). Os contadores de acertos, faltas e descartes ficam
+# disponíveis em estatisticas().
+
+import hashlib
+from collections import OrderedDict
+
+import numpy as np
+
+
+def impressao_digital(A):
+    A = np.ascontiguousarray(A, dtype=float)
+    h = hashlib.blake2b(digest_size=16)
+    h.update(str(A.shape).encode())
+    h.update(A.data)
+    return h.hexdigest()
+
+
+class CacheFatoracoes:
+    def __init__(self, limite_bytes=64 * 2**20):
+        self.limite_bytes = limite_bytes
+        self.bytes = 0
+        self.acertos = 0
+        self.faltas = 0
+        self.descartes = 0
+        self._itens = OrderedDict()  # chave -> (fatoração, tamanho em bytes)
+
+    def obter(self, A, fatorar, tamanho=None, tipo=None):
+        # Devolve a fatoração de A guardada, ou calcula fatorar(A) e guarda.
+        # tamanho(fatoração) dá os bytes ocupados; por padrão usa o atributo nbytes.
+        # tipo identifica a fatoração na chave; por padrão é o nome qualificado de fatorar
+        # (obrigatório passar quando fatorar é uma lambda).
+        if tipo is None:
+            tipo = fatorar.__qualname__
+        chave = (tipo, impressao_digital(A))
+
+        if chave in self._itens:
+            self.acertos += 1
+            self._itens.move_to_end(chave)
+            return self._itens[chave][0]
+
+        self.faltas += 1
+        fatoracao = fatorar(A)
+        nbytes = tamanho(fatoracao) if tamanho is not None else fatoracao.nbytes
+
+        # Uma fatoração maior que o cache inteiro não é guardada
+        if nbytes > self.limite_bytes:
+            return fatoracao
+
+        self._itens[chave] = (fatoracao, nbytes)
+        self.bytes += nbytes
+
+        while self.bytes > self.limite_bytes:
+            _, (_, liberado) = self._itens.popitem(last=False)
+            self.bytes -= liberado
+            self.descartes += 1
+
+        return fatoracao
+
+    def __len__(self):
+        return len(self._itens)
+
+    def limpar(self):
+        self._itens.clear()
+        self.bytes = 0
+
+    def estatisticas(self):
+        return {
+            "acertos": self.acertos,
+            "faltas": self.faltas,
+            "descartes": self.descartes,
+            "itens": len(self._itens),
+            "bytes": self.bytes,
+        }
+
+
+if __name__ == "__main__":
+    # Exemplo: "fatoração" fictícia que só conta quantas vezes foi chamada
+    chamadas = []
+
+    def fatorar(A):
+        chamadas.append(1)
+        return np.array(A, dtype=float)
+
+    cache = CacheFatoracoes(limite_bytes=2 * 4 * 8)  # cabem duas matrizes 2x2
+    for A in [[[1, 2], [3, 4]], [[1, 2], [3, 4]], [[5, 6], [7, 8]], [[0, 1], [1, 0]], [[1, 2], [3, 4]]]:
+        cache.obter(A, fatorar)
+
+    print("fatorações calculadas:", len(chamadas))
+    print(cache.estatisticas())
@@ -0,0 +1,95 @@
+# Matriz esparsa no formato CSR (compressed sparse row).
+#
+# Só os elementos não nulos são guardados, linha por linha, em três arrays NumPy:
+#     dados[p]     valor do p-ésimo elemento não nulo
+#     indices[p]   coluna desse elemento
+#     ponteiros[i] posição em dados/indices onde começa a linha i (ponteiros[n] = nnz)
+# A memória é O(nnz) e o produto matriz-vetor custa O(nnz).
+
+import numpy as np
+
+
+class MatrizCSR:
+    def __init__(self, dados, indices, ponteiros, forma):
+        self.dados = np.asarray(dados, dtype=float)
+        self.indices = np.asarray(indices, dtype=np.int64)
+        self.ponteiros = np.asarray(ponteiros, dtype=np.int64)
+        self.forma = tuple(forma)
+        self._linhas = None
+
+        if len(self.ponteiros) != self.forma[0] + 1 or self.ponteiros[-1] != len(self.dados):
+            raise ValueError("Ponteiros de linha inconsistentes com os dados.")
+
+    @classmethod
+    def de_densa(cls, A):
+        A = np.asarray(A, dtype=float)
+        linhas, colunas = np.nonzero(A)
+        ponteiros = np.zeros(A.shape[0] + 1, dtype=np.int64)
+        np.cumsum(np.bincount(linhas, minlength=A.shape[0]), out=ponteiros[1:])
+        return cls(A[linhas, colunas], colunas, ponteiros, A.shape)
+
+    @classmethod
+    def de_coordenadas(cls, linhas, colunas, valores, forma):
+        # Monta a matriz a partir de triplas (i, j, a_ij); triplas repetidas são somadas
+        linhas = np.asarray(linhas, dtype=np.int64)
+        colunas = np.asarray(colunas, dtype=np.int64)
+        valores = np.asarray(valores, dtype=float)
+
+        chave = linhas * forma[1] + colunas
+        chave, inverso = np.unique(chave, return_inverse=True)
+        soma = np.bincount(inverso.ravel(), weights=valores, minlength=len(chave))
+
+        linhas, colunas = np.divmod(chave, forma[1])
+        ponteiros = np.zeros(forma[0] + 1, dtype=np.int64)
+        np.cumsum(np.bincount(linhas, minlength=forma[0]), out=ponteiros[1:])
+        return cls(soma, colunas, ponteiros, forma)
+
+    @property
+    def nnz(self):
+        return len(self.dados)
+
+    def linhas(self):
+        # Linha de cada elemento não nulo (calculada uma vez só)
+        if self._linhas is None:
+            self._linhas = np.repeat(np.arange(self.forma[0]), np.diff(self.ponteiros))
+        return self._linhas
+
+    def diagonal(self):
+        d = np.zeros(min(self.forma))
+        linhas = self.linhas()
+        na_diagonal = linhas == self.indices
+        d[linhas[na_diagonal]] = self.dados[na_diagonal]
+        return d
+
+    def multiplicar(self, x):
+        # y = A x em O(nnz)
+        x = np.asarray(x, dtype=float)
+        return np.bincount(self.linhas(), weights=self.dados * x[self.indices], minlength=self.forma[0])
+
+    def __matmul__(self, x):
+        return self.multiplicar(x)
+
+    def submatriz_linhas(self, linhas):
+        # Nova MatrizCSR só com as linhas escolhidas (todas as colunas são mantidas)
+        linhas = np.asarray(linhas, dtype=np.int64)
+        inicio, fim = self.ponteiros[linhas], self.ponteiros[linhas + 1]
+        tamanhos = fim - inicio
+        ponteiros = np.zeros(len(linhas) + 1, dtype=np.int64)
+        np.cumsum(tamanhos, out=ponteiros[1:])
+        posicoes = np.repeat(inicio - ponteiros[:-1], tamanhos) + np.arange(ponteiros[-1])
+        return MatrizCSR(self.dados[posicoes], self.indices[posicoes], ponteiros, (len(linhas), self.forma[1]))
+
+    def para_densa(self):
+        A = np.zeros(self.forma)
+        A[self.linhas(), self.indices] = self.dados
+        return A
+
+
+if __name__ == "__main__":
+    A = MatrizCSR.de_densa([[10, 2, 0],
+                            [1, 5, 1],
+                            [0, 3, 10]])
+    print("nnz:", A.nnz)
+    print("dados:", A.dados, "indices:", A.indices, "ponteiros:", A.ponteiros)
+    print("A @ [1, 1, 1] =", A @ [1, 1, 1])
+    print("diagonal:", A.diagonal())
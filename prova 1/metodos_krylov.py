@@ -0,0 +1,260 @@
+# Métodos de Krylov para sistemas lineares: gradiente conjugado (A simétrica positiva
+# definida), GMRES com reinício e BiCGSTAB (A qualquer).
+#
+# A pode ser uma matriz densa (lista de listas ou array), uma MatrizCSR ou uma função
+# que calcula A @ v. M é um precondicionador opcional: uma função que aproxima A^-1 r,
+# por exemplo uma varredura de Jacobi, de Gauss-Seidel ou de SSOR.
+# Todos param quando ||b - Ax|| / ||b|| < e e retornam a solução e o número de iterações.
+
+import numpy as np
+
+from matriz_esparsa import MatrizCSR
+
+
+def operador(A):
+    if callable(A):
+        return A
+    if isinstance(A, MatrizCSR):
+        return A.multiplicar
+    A = np.asarray(A, dtype=float)
+    return lambda v: A @ v
+
+
+def _csr(A):
+    return A if isinstance(A, MatrizCSR) else MatrizCSR.de_densa(A)
+
+
+def precondicionador_jacobi(A):
+    # M = D: divide o resíduo pela diagonal
+    d = _csr(A).diagonal()
+    if np.any(d == 0):
+        raise ValueError("A diagonal da matriz tem elemento nulo.")
+    return lambda r: r / d
+
+
+def _varredura(dados, indices, ponteiros, d, r, z, omega, ordem):
+    # Uma varredura de Gauss-Seidel (SOR) para A z = r, atualizando z no lugar
+    for i in ordem:
+        soma = r[i]
+        for p in range(ponteiros[i], ponteiros[i + 1]):
+            j = indices[p]
+            if j != i:
+                soma -= dados[p] * z[j]
+        z[i] = (1 - omega) * z[i] + omega * soma / d[i]
+
+
+def precondicionador_gauss_seidel(A, omega=1.0):
+    # Uma varredura de Gauss-Seidel (ou SOR) a partir de z = 0: M = D/ω + L
+    A = _csr(A)
+    dados, indices, ponteiros = A.dados.tolist(), A.indices.tolist(), A.ponteiros.tolist()
+    d = A.diagonal().tolist()
+    n = len(d)
+
+    def aplicar(r):
+        z = [0.0] * n
+        _varredura(dados, indices, ponteiros, d, r.tolist(), z, omega, range(n))
+        return np.array(z)
+
+    return aplicar
+
+
+def precondicionador_ssor(A, omega=1.0):
+    # Varredura para frente seguida de varredura para trás (SSOR), a partir de z = 0.
+    # Para A simétrica o precondicionador é simétrico e pode ser usado no gradiente conjugado.
+    A = _csr(A)
+    dados, indices, ponteiros = A.dados.tolist(), A.indices.tolist(), A.ponteiros.tolist()
+    d = A.diagonal().tolist()
+    n = len(d)
+
+    def aplicar(r):
+        z = [0.0] * n
+        r = r.tolist()
+        _varredura(dados, indices, ponteiros, d, r, z, omega, range(n))
+        _varredura(dados, indices, ponteiros, d, r, z, omega, range(n - 1, -1, -1))
+        return np.array(z)
+
+    return aplicar
+
+
+def gradiente_conjugado(A, b, e, max_i, M=None, x0=None):
+    Av = operador(A)
+    b = np.asarray(b, dtype=float)
+    x = np.zeros(len(b)) if x0 is None else np.array(x0, dtype=float)
+    norma_b = np.linalg.norm(b) or 1.0
+
+    r = b - Av(x)
+    z = r if M is None else M(r)
+    p = z.copy()
+    rz = r @ z
+
+    for k in range(1, max_i + 1):
+        if np.linalg.norm(r) < e * norma_b:
+            return x, k - 1
+
+        Ap = Av(p)
+        pAp = p @ Ap
+        if pAp <= 0:
+            raise ValueError("A matriz não é simétrica positiva definida.")
+
+        alfa = rz / pAp
+        x += alfa * p
+        r -= alfa * Ap
+
+        z = r if M is None else M(r)
+        rz_novo = r @ z
+        p = z + (rz_novo / rz) * p
+        rz = rz_novo
+
+    if np.linalg.norm(r) < e * norma_b:
+        return x, max_i
+
+    print("Número máximo de iterações atingido:", max_i)
+    return x, max_i
+
+
+def gmres(A, b, e, max_i, reinicio=30, M=None, x0=None):
+    # GMRES(m) com precondicionamento à direita: resolve A M^-1 y = b, x = M^-1 y,
+    # de modo que o resíduo medido é o resíduo verdadeiro b - Ax
+    Av = operador(A)
+    Mv = (lambda v: v) if M is None else M
+    b = np.asarray(b, dtype=float)
+    n = len(b)
+    x = np.zeros(n) if x0 is None else np.array(x0, dtype=float)
+    norma_b = np.linalg.norm(b) or 1.0
+    m = min(reinicio, n)
+
+    k = 0
+    while k < max_i:
+        r = b - Av(x)
+        beta = np.linalg.norm(r)
+        if beta < e * norma_b:
+            return x, k
+
+        V = np.zeros((m + 1, n))  # base de Arnoldi (uma linha por vetor)
+        H = np.zeros((m + 1, m))
+        cs, sn = np.zeros(m), np.zeros(m)  # rotações de Givens
+        g = np.zeros(m + 1)
+        g[0] = beta
+        V[0] = r / beta
+
+        for j in range(m):
+            k += 1
+            w = Av(Mv(V[j]))
+
+            # Gram-Schmidt modificado
+            for i in range(j + 1):
+                H[i, j] = w @ V[i]
+                w -= H[i, j] * V[i]
+            H[j + 1, j] = np.linalg.norm(w)
+            if H[j + 1, j] != 0:
+                V[j + 1] = w / H[j + 1, j]
+
+            # Aplica as rotações anteriores e calcula a nova, zerando H[j+1, j]
+            for i in range(j):
+                H[i, j], H[i + 1, j] = cs[i] * H[i, j] + sn[i] * H[i + 1, j], -sn[i] * H[i, j] + cs[i] * H[i + 1, j]
+            raio = np.hypot(H[j, j], H[j + 1, j])
+            cs[j], sn[j] = H[j, j] / raio, H[j + 1, j] / raio
+            H[j, j], H[j + 1, j] = raio, 0.0
+            g[j], g[j + 1] = cs[j] * g[j], -sn[j] * g[j]
+
+            # |g[j+1]| é a norma do resíduo atual, sem precisar formar x
+            if abs(g[j + 1]) < e * norma_b or k >= max_i or H[j, j] == 0:
+                break
+
+        # Resolve o sistema triangular H y = g e atualiza x
+        tamanho = j + 1
+        y = np.zeros(tamanho)
+        for i in range(tamanho - 1, -1, -1):
+            y[i] = (g[i] - H[i, i + 1:tamanho] @ y[i + 1:]) / H[i, i]
+        x += Mv(y @ V[:tamanho])
+
+        if abs(g[tamanho]) < e * norma_b:
+            return x, k
+
+    print("Número máximo de iterações atingido:", max_i)
+    return x, k
+
+
+def bicgstab(A, b, e, max_i, M=None, x0=None):
+    Av = operador(A)
+    Mv = (lambda v: v) if M is None else M
+    b = np.asarray(b, dtype=float)
+    x = np.zeros(len(b)) if x0 is None else np.array(x0, dtype=float)
+    norma_b = np.linalg.norm(b) or 1.0
+
+    r = b - Av(x)
+    r0 = r.copy()
+    rho = alfa = omega = 1.0
+    v = np.zeros(len(b))
+    p = np.zeros(len(b))
+
+    for k in range(1, max_i + 1):
+        if np.linalg.norm(r) < e * norma_b:
+            return x, k - 1
+
+        rho_novo = r0 @ r
+        if rho_novo == 0:
+            raise ValueError("BiCGSTAB falhou: (r0, r) = 0.")
+        p = r + (rho_novo / rho) * (alfa / omega) * (p - omega * v)
+        rho = rho_novo
+
+        p_hat = Mv(p)
+        v = Av(p_hat)
+        r0v = r0 @ v
+        if r0v == 0:
+            raise ValueError("BiCGSTAB falhou: (r0, v) = 0.")
+        alfa = rho / r0v
+        s = r - alfa * v
+
+        if np.linalg.norm(s) < e * norma_b:
+            x += alfa * p_hat
+            return x, k
+
+        s_hat = Mv(s)
+        t = Av(s_hat)
+
+        # Quebras testadas antes de alterar x
+        tt = t @ t
+        if tt == 0:
+            raise ValueError("BiCGSTAB falhou: (t, t) = 0.")
+        omega = (t @ s) / tt
+        if omega == 0:
+            raise ValueError("BiCGSTAB falhou: ω = 0.")
+
+        x += alfa * p_hat + omega * s_hat
+        r = s - omega * t
+
+    if np.linalg.norm(r) < e * norma_b:
+        return x, max_i
+
+    print("Número máximo de iterações atingido:", max_i)
+    return x, max_i
+
+
+if __name__ == "__main__":
+    # Exemplo: Poisson 1D com 2000 incógnitas (simétrica positiva definida)
+    n = 2000
+    i = np.arange(n)
+    A = MatrizCSR.de_coordenadas(
+        np.concatenate([i, i[1:], i[:-1]]),
+        np.concatenate([i, i[:-1], i[1:]]),
+        np.concatenate([np.full(n, 2.0), np.full(n - 1, -1.0), np.full(n - 1, -1.0)]),
+        (n, n))
+    b = A @ np.ones(n)
+    e = 1e-8
+
+    for nome, M in [("sem precondicionador", None),
+                    ("Jacobi", precondicionador_jacobi(A)),
+                    ("SSOR", precondicionador_ssor(A, 1.9))]:
+        x, k = gradiente_conjugado(A, b, e, 5000, M)
+        print(f"CG {nome}: {k} iterações, erro máximo {np.max(np.abs(x - 1)):.2e}")
+
+    # Sistema não simétrico (convecção-difusão), densa, e um operador dado por função
+    B = np.diag(np.full(200, 3.0)) + np.diag(np.full(199, -1.5), 1) + np.diag(np.full(199, -0.5), -1)
+    c = B @ np.ones(200)
+
+    x, k = gmres(B, c, e, 1000, reinicio=20, M=precondicionador_gauss_seidel(B))
+    print(f"GMRES(20) com Gauss-Seidel: {k} iterações, erro máximo {np.max(np.abs(x - 1)):.2e}")
+
+    x, k = bicgstab(lambda v: B @ v, c, e, 1000, M=precondicionador_jacobi(B))
+    print(f"BiCGSTAB com Jacobi: {k} iterações, erro máximo {np.max(np.abs(x - 1)):.2e}")
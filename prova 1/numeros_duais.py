@@ -0,0 +1,121 @@
+# Números duais para diferenciação automática (modo direto):
+# um Dual(v, d) carrega o valor v = f(x) e a derivada d = f'(x) ao mesmo tempo.
+
+import math
+
+
+class Dual:
+    __slots__ = ("valor", "derivada")
+
+    def __init__(self, valor, derivada=0.0):
+        self.valor = valor
+        self.derivada = derivada
+
+    def __repr__(self):
+        return f"Dual({self.valor}, {self.derivada})"
+
+    def __add__(self, outro):
+        if isinstance(outro, Dual):
+            return Dual(self.valor + outro.valor, self.derivada + outro.derivada)
+        return Dual(self.valor + outro, self.derivada)
+
+    __radd__ = __add__
+
+    def __sub__(self, outro):
+        if isinstance(outro, Dual):
+            return Dual(self.valor - outro.valor, self.derivada - outro.derivada)
+        return Dual(self.valor - outro, self.derivada)
+
+    def __rsub__(self, outro):
+        return Dual(outro - self.valor, -self.derivada)
+
+    def __mul__(self, outro):
+        if isinstance(outro, Dual):
+            return Dual(self.valor * outro.valor, self.derivada * outro.valor + self.valor * outro.derivada)
+        return Dual(self.valor * outro, self.derivada * outro)
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, outro):
+        if isinstance(outro, Dual):
+            return Dual(self.valor / outro.valor,
+                        (self.derivada * outro.valor - self.valor * outro.derivada) / outro.valor**2)
+        return Dual(self.valor / outro, self.derivada / outro)
+
+    def __rtruediv__(self, outro):
+        return Dual(outro / self.valor, -outro * self.derivada / self.valor**2)
+
+    def __neg__(self):
+        return Dual(-self.valor, -self.derivada)
+
+    def __pos__(self):
+        return self
+
+    def __abs__(self):
+        return self if self.valor >= 0 else -self
+
+    def __pow__(self, outro):
+        if isinstance(outro, Dual):
+            # u**v = exp(v ln u)
+            valor = self.valor ** outro.valor
+            return Dual(valor, valor * (outro.derivada * math.log(self.valor) + outro.valor * self.derivada / self.valor))
+        return Dual(self.valor ** outro, outro * self.valor ** (outro - 1) * self.derivada)
+
+    def __rpow__(self, base):
+        # base**x, por exemplo e**x
+        valor = base ** self.valor
+        return Dual(valor, valor * math.log(base) * self.derivada)
+
+    # Comparações usam só o valor, para que testes como "if x < 0" funcionem
+    def __eq__(self, outro):
+        return self.valor == (outro.valor if isinstance(outro, Dual) else outro)
+
+    def __lt__(self, outro):
+        return self.valor < (outro.valor if isinstance(outro, Dual) else outro)
+
+    def __le__(self, outro):
+        return self.valor <= (outro.valor if isinstance(outro, Dual) else outro)
+
+    def __gt__(self, outro):
+        return self.valor > (outro.valor if isinstance(outro, Dual) else outro)
+
+    def __ge__(self, outro):
+        return self.valor >= (outro.valor if isinstance(outro, Dual) else outro)
+
+    __hash__ = None
+
+
+# Funções no estilo do módulo math que aceitam tanto números quanto Duais
+def _elementar(funcao, derivada):
+    def aplicar(x):
+        if isinstance(x, Dual):
+            return Dual(funcao(x.valor), derivada(x.valor) * x.derivada)
+        return funcao(x)
+    aplicar.__name__ = funcao.__name__
+    return aplicar
+
+
+exp = _elementar(math.exp, math.exp)
+log = _elementar(math.log, lambda v: 1 / v)
+log10 = _elementar(math.log10, lambda v: 1 / (v * math.log(10)))
+sqrt = _elementar(math.sqrt, lambda v: 0.5 / math.sqrt(v))
+sin = _elementar(math.sin, math.cos)
+cos = _elementar(math.cos, lambda v: -math.sin(v))
+tan = _elementar(math.tan, lambda v: 1 / math.cos(v)**2)
+atan = _elementar(math.atan, lambda v: 1 / (1 + v**2))
+e = math.e
+pi = math.pi
+
+
+def valor_e_derivada(f, x):
+    # Calcula f(x) e f'(x) com uma única avaliação de f
+    y = f(Dual(x, 1.0))
+    if isinstance(y, Dual):
+        return y.valor, y.derivada
+    return y, 0.0  # f constante
+
+
+if __name__ == "__main__":
+    # Exemplo: f(x) = x*log10(x) - 1, f'(x) = log10(x) + 1/ln(10)
+    print(valor_e_derivada(lambda x: x*log10(x) - 1, 2.5))
+    print(log10(2.5) + 1 / math.log(10))
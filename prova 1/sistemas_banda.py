@@ -0,0 +1,151 @@
+# Sistemas lineares com matriz em banda: a_ij = 0 sempre que i - j > p ou j - i > q.
+#
+# A matriz é guardada só com as suas diagonais, num array (2p + q + 1) x n no mesmo
+# esquema do LAPACK: AB[p + q + i - j, j] = a_ij. As p linhas de cima ficam livres para o
+# preenchimento que o pivoteamento parcial pode criar (U passa a ter banda superior p + q).
+# A fatoração custa O(n p (p + q)) e a memória O(n (2p + q)), em vez de O(n³) e O(n²).
+
+import numpy as np
+
+
+def largura_banda(A):
+    # Devolve (p, q): maior distância de um elemento não nulo abaixo e acima da diagonal
+    linhas, colunas = np.nonzero(np.asarray(A))
+    if len(linhas) == 0:
+        return 0, 0
+    return max(int(np.max(linhas - colunas)), 0), max(int(np.max(colunas - linhas)), 0)
+
+
+def thomas(a, d, c, r):
+    # Algoritmo de Thomas para sistema tridiagonal, O(n), sem pivoteamento:
+    # a = subdiagonal (n-1), d = diagonal (n), c = superdiagonal (n-1), r = termos independentes
+    n = len(d)
+    a, d, c, r = list(map(float, a)), list(map(float, d)), list(map(float, c)), list(map(float, r))
+
+    # Eliminação da subdiagonal
+    for i in range(1, n):
+        if d[i - 1] == 0:
+            raise ValueError("Pivô nulo no algoritmo de Thomas.")
+        m = a[i - 1] / d[i - 1]
+        d[i] -= m * c[i - 1]
+        r[i] -= m * r[i - 1]
+
+    if d[n - 1] == 0:
+        raise ValueError("Pivô nulo no algoritmo de Thomas.")
+
+    # Substituição retroativa
+    x = [0.0] * n
+    x[n - 1] = r[n - 1] / d[n - 1]
+    for i in range(n - 2, -1, -1):
+        x[i] = (r[i] - c[i] * x[i + 1]) / d[i]
+
+    return x
+
+
+class FatoracaoBanda:
+    def __init__(self, A, p=None, q=None, pivoteamento=True):
+        A = np.asarray(A, dtype=float)
+        n = A.shape[0]
+        if p is None or q is None:
+            p, q = largura_banda(A)
+
+        # Só as diagonais de -p a q são copiadas para o armazenamento em banda
+        AB = np.zeros((2*p + q + 1, n))
+        for deslocamento in range(-p, q + 1):
+            diagonal = np.diagonal(A, deslocamento)
+            if deslocamento >= 0:
+                AB[p + q - deslocamento, deslocamento:] = diagonal
+            else:
+                AB[p + q - deslocamento, :n + deslocamento] = diagonal
+
+        self._fatorar(AB, n, p, q, pivoteamento)
+
+    @classmethod
+    def de_diagonais(cls, AB, p, q, pivoteamento=True):
+        # AB já no armazenamento em banda, com as p linhas extras de cima
+        fatoracao = cls.__new__(cls)
+        AB = np.array(AB, dtype=float)
+        fatoracao._fatorar(AB, AB.shape[1], p, q, pivoteamento)
+        return fatoracao
+
+    def _fatorar(self, AB, n, p, q, pivoteamento):
+        piv = np.arange(n)
+        largura = p + q if pivoteamento else q  # banda superior de U
+
+        for k in range(n):
+            m = min(p, n - 1 - k)
+            w = min(largura, n - 1 - k) + 1
+
+            # Janela densa (m+1) x w da parte ativa: linhas k..k+m, colunas k..k+w-1
+            I = k + np.arange(m + 1)
+            J = k + np.arange(w)
+            R = p + q + I[:, None] - J[None, :]
+            janela = AB[R, J]
+
+            r = int(np.argmax(np.abs(janela[:, 0]))) if pivoteamento else 0
+            if janela[r, 0] == 0:
+                raise ValueError("A matriz é singular.")
+            if r != 0:
+                janela[[0, r]] = janela[[r, 0]]
+                piv[k] = k + r
+
+            if m:
+                janela[1:, 0] /= janela[0, 0]
+                janela[1:, 1:] -= np.outer(janela[1:, 0], janela[0, 1:])
+
+            AB[R, J] = janela
+
+        self.AB = AB
+        self.piv = piv
+        self.p, self.q, self.largura = p, q, largura
+
+    @property
+    def nbytes(self):
+        return self.AB.nbytes + self.piv.nbytes
+
+    def resolver(self, b):
+        # b pode ser um vetor ou uma matriz n x k
+        AB, piv, p, q = self.AB, self.piv, self.p, self.q
+        n = AB.shape[1]
+        x = np.array(b, dtype=float)
+
+        # Trocas de linha e eliminação na mesma ordem da fatoração (L x = P b)
+        for k in range(n - 1):
+            if piv[k] != k:
+                x[[k, piv[k]]] = x[[piv[k], k]]
+            m = min(p, n - 1 - k)
+            if m:
+                x[k + 1:k + 1 + m] -= np.multiply.outer(AB[p + q + 1:p + q + 1 + m, k], x[k])
+
+        # Substituição retroativa em U (banda superior "largura")
+        for i in range(n - 1, -1, -1):
+            J = np.arange(i + 1, min(i + self.largura, n - 1) + 1)
+            x[i] = (x[i] - AB[p + q + i - J, J] @ x[J]) / AB[p + q, i]
+
+        return x
+
+
+def resolver_banda(A, b, pivoteamento=True):
+    # Escolhe o caminho rápido: Thomas para tridiagonais, LU em banda para as demais
+    p, q = largura_banda(A)
+    A = np.asarray(A, dtype=float)
+    if p == 1 and q == 1 and np.ndim(b) == 1:
+        try:
+            return np.array(thomas(np.diagonal(A, -1), np.diagonal(A), np.diagonal(A, 1), b))
+        except ValueError:
+            pass  # pivô nulo: usa a fatoração em banda com pivoteamento
+    return FatoracaoBanda(A, p, q, pivoteamento).resolver(b)
+
+
+if __name__ == "__main__":
+    # Exemplo: sistema pentadiagonal 8 x 8
+    n = 8
+    A = (np.diag(np.full(n, 6.0)) + np.diag(np.full(n - 1, -4.0), 1) + np.diag(np.full(n - 1, -4.0), -1)
+         + np.diag(np.full(n - 2, 1.0), 2) + np.diag(np.full(n - 2, 1.0), -2))
+    b = A @ np.arange(1.0, n + 1)
+
+    print("Largura de banda:", largura_banda(A))
+    print("Solução:", FatoracaoBanda(A).resolver(b))
+
+    # Tridiagonal: algoritmo de Thomas
+    print("Thomas:", thomas([1, 1], [4, 4, 4], [1, 1], [5, 6, 5]))
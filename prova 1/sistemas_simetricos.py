@@ -0,0 +1,165 @@
+# Sistemas lineares com matriz simétrica: fatorações de Cholesky (A = L Lᵀ, A simétrica
+# positiva definida) e LDLᵀ (A = L D Lᵀ, L com diagonal unitária).
+#
+# Só o triângulo inferior é guardado, linha por linha, num vetor de n(n+1)/2 posições
+# (armazenamento "empacotado"): o elemento (i, j), j <= i, fica em P[i(i+1)/2 + j], de
+# modo que a linha i do triângulo é a fatia contígua P[i(i+1)/2 : i(i+1)/2 + i + 1].
+# Cada fatoração custa n³/3 flops e n²/2 de memória, metade da LU (2n³/3 e n²).
+
+import numpy as np
+
+
+def inicio_linha(i):
+    # Posição do elemento (i, 0) no vetor empacotado
+    return i * (i + 1) // 2
+
+
+def eh_simetrica(A, tol=1e-12):
+    A = np.asarray(A, dtype=float)
+    if A.ndim != 2 or A.shape[0] != A.shape[1]:
+        return False
+    return bool(np.all(np.abs(A - A.T) <= tol * np.max(np.abs(A), initial=0.0)))
+
+
+def empacotar(A):
+    # Triângulo inferior de A no armazenamento empacotado
+    A = np.asarray(A, dtype=float)
+    return A[np.tril_indices(A.shape[0])]
+
+
+def desempacotar(P, simetrica=True):
+    # Matriz densa a partir do vetor empacotado (simétrica ou só o triângulo inferior)
+    n = int(round((np.sqrt(8 * len(P) + 1) - 1) / 2))
+    A = np.zeros((n, n))
+    A[np.tril_indices(n)] = P
+    if simetrica:
+        A += np.tril(A, -1).T
+    return A
+
+
+def _linhas(P, n):
+    # Visões das linhas do triângulo (sem cópia)
+    return [P[inicio_linha(i):inicio_linha(i) + i + 1] for i in range(n)]
+
+
+class FatoracaoCholesky:
+    # A = L Lᵀ; L fica empacotada em self.L. Lança ValueError se A não for positiva definida.
+
+    def __init__(self, A):
+        A = np.asarray(A, dtype=float)
+        n = A.shape[0]
+        if A.ndim != 2 or A.shape[1] != n:
+            raise ValueError("A matriz deve ser quadrada")
+
+        L = empacotar(A)
+        linhas = _linhas(L, n)
+
+        # Cholesky-Banachiewicz: a linha i só depende das linhas 0..i-1, já prontas
+        for i in range(n):
+            li = linhas[i]
+            for j in range(i):
+                li[j] = (li[j] - li[:j] @ linhas[j][:j]) / linhas[j][j]
+            d = li[i] - li[:i] @ li[:i]
+            if d <= 0:
+                raise ValueError("A matriz não é positiva definida.")
+            li[i] = np.sqrt(d)
+
+        self.L = L
+        self.n = n
+
+    @property
+    def nbytes(self):
+        return self.L.nbytes
+
+    def resolver(self, b):
+        # L y = b e depois Lᵀ x = y; b pode ser um vetor ou uma matriz n x k
+        linhas = _linhas(self.L, self.n)
+        x = np.array(b, dtype=float)
+
+        # Substituição direta: linha i de L é contígua
+        for i in range(self.n):
+            x[i] = (x[i] - linhas[i][:i] @ x[:i]) / linhas[i][i]
+
+        # Substituição retroativa com Lᵀ, orientada por colunas de Lᵀ (= linhas de L)
+        for i in range(self.n - 1, -1, -1):
+            x[i] /= linhas[i][i]
+            x[:i] -= np.multiply.outer(linhas[i][:i], x[i])
+
+        return x
+
+
+class FatoracaoLDLT:
+    # A = L D Lᵀ sem pivoteamento; serve também para simétricas indefinidas cujos pivôs
+    # não se anulam. L (diagonal unitária implícita) e D ficam no mesmo vetor empacotado:
+    # a posição da diagonal guarda d_i.
+
+    def __init__(self, A):
+        A = np.asarray(A, dtype=float)
+        n = A.shape[0]
+        if A.ndim != 2 or A.shape[1] != n:
+            raise ValueError("A matriz deve ser quadrada")
+
+        LD = empacotar(A)
+        linhas = _linhas(LD, n)
+        d = np.zeros(n)
+
+        for i in range(n):
+            li = linhas[i]
+            # w_j = l_ij d_j, calculado antes da divisão por d_j
+            w = np.zeros(i)
+            for j in range(i):
+                w[j] = li[j] - w[:j] @ linhas[j][:j]
+                li[j] = w[j] / d[j]
+            d[i] = li[i] - w @ li[:i]
+            if d[i] == 0:
+                raise ValueError("Pivô nulo na fatoração LDLᵀ.")
+            li[i] = d[i]
+
+        self.LD = LD
+        self.D = d
+        self.n = n
+
+    @property
+    def nbytes(self):
+        return self.LD.nbytes + self.D.nbytes
+
+    def resolver(self, b):
+        # L z = b, D y = z, Lᵀ x = y; b pode ser um vetor ou uma matriz n x k
+        linhas = _linhas(self.LD, self.n)
+        x = np.array(b, dtype=float)
+
+        for i in range(1, self.n):
+            x[i] -= linhas[i][:i] @ x[:i]
+
+        x /= self.D if x.ndim == 1 else self.D[:, None]
+
+        for i in range(self.n - 1, 0, -1):
+            x[:i] -= np.multiply.outer(linhas[i][:i], x[i])
+
+        return x
+
+
+def resolver_simetrico(A, b):
+    # Cholesky quando A é positiva definida; senão LDLᵀ
+    try:
+        return FatoracaoCholesky(A).resolver(b)
+    except ValueError:
+        return FatoracaoLDLT(A).resolver(b)
+
+
+if __name__ == "__main__":
+    # Exemplo: equações normais de um ajuste de parábola (XᵀX simétrica positiva definida)
+    t = np.linspace(0, 1, 20)
+    X = np.column_stack([np.ones_like(t), t, t**2])
+    y = 1 + 2*t - 3*t**2
+    A = X.T @ X
+
+    print("Simétrica:", eh_simetrica(A))
+    print("Empacotada:", empacotar(A))
+    print("Coeficientes (Cholesky):", FatoracaoCholesky(A).resolver(X.T @ y))
+
+    # Simétrica indefinida: Cholesky falha, LDLᵀ resolve
+    B = [[1, 2, 3],
+         [2, -4, 1],
+         [3, 1, 2]]
+    print("LDLᵀ:", FatoracaoLDLT(B).D, resolver_simetrico(B, [6, -1, 6]))
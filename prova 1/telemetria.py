@@ -0,0 +1,145 @@
+# Instrumentação comum aos métodos da prova 1.
+#
+# Os métodos recebem telemetria=None por padrão e, nesse caso, não fazem nada além de
+# um teste "is None": nenhum print, nenhuma alocação. Com uma Telemetria, contam as
+# avaliações de f e as iterações e, se houver capacidade, guardam cada iteração num
+# buffer circular pré-alocado (os registros mais antigos são sobrescritos). Os buffers de x e
+# f(x) passam a ser complexos no primeiro registro complexo (Müller, raízes de polinômios).
+#
+# Uso:
+#     tel = Telemetria(capacidade=1000)
+#     with tel:                        # mede o tempo de relógio do bloco
+#         bisseccao(a, b, e, telemetria=tel)
+#     tel.imprimir()
+
+import cmath
+import csv
+import math
+import time
+
+import numpy as np
+
+
+def _basico(valores):
+    # Complexos viram pares [real, imaginário], que o json consegue gravar
+    if valores.dtype.kind == "c":
+        return np.column_stack([valores.real, valores.imag]).tolist()
+    return valores.tolist()
+
+
+class Telemetria:
+    def __init__(self, capacidade=0):
+        self.avaliacoes = 0
+        self.iteracoes = 0
+        self.tempo = 0.0
+        self.contadores = {}  # contadores extras (fatorações, soluções, ...)
+
+        self.capacidade = capacidade
+        self._total = 0
+        self._k = np.zeros(capacidade, dtype=np.int64)
+        self._x = np.zeros(capacidade)
+        self._fx = np.zeros(capacidade)
+        self._a = np.zeros(capacidade)
+        self._b = np.zeros(capacidade)
+        self._inicio = None
+
+    def __enter__(self):
+        self._inicio = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.tempo += time.perf_counter() - self._inicio
+        self._inicio = None
+        return False
+
+    def contar(self, f):
+        # Devolve f embrulhada: cada chamada conta como uma avaliação
+        def contada(*args, **kwargs):
+            self.avaliacoes += 1
+            return f(*args, **kwargs)
+        return contada
+
+    def incrementar(self, nome, n=1):
+        self.contadores[nome] = self.contadores.get(nome, 0) + n
+
+    def registrar(self, k, x, fx=math.nan, a=math.nan, b=math.nan):
+        self.iteracoes += 1
+        if self.capacidade:
+            if self._x.dtype.kind != "c" and (np.iscomplexobj(x) or np.iscomplexobj(fx)):
+                self._x = self._x.astype(complex)
+                self._fx = self._fx.astype(complex)
+            i = self._total % self.capacidade
+            self._k[i] = k
+            self._x[i] = x
+            self._fx[i] = fx
+            self._a[i] = a
+            self._b[i] = b
+            self._total += 1
+
+    def trace(self):
+        # Registros guardados, do mais antigo para o mais recente
+        n = min(self._total, self.capacidade)
+        if self._total > self.capacidade:
+            ordem = (np.arange(n) + self._total) % self.capacidade
+        else:
+            ordem = np.arange(n)
+        return {
+            "k": self._k[ordem],
+            "x": self._x[ordem],
+            "fx": self._fx[ordem],
+            "a": self._a[ordem],
+            "b": self._b[ordem],
+        }
+
+    def exportar(self):
+        # Dicionário só com tipos básicos, pronto para json.dump
+        return {
+            "avaliacoes": self.avaliacoes,
+            "iteracoes": self.iteracoes,
+            "tempo": self.tempo,
+            "contadores": dict(self.contadores),
+            "descartados": max(self._total - self.capacidade, 0),
+            "trace": {chave: _basico(valores) for chave, valores in self.trace().items()},
+        }
+
+    def para_csv(self, caminho):
+        trace = self.trace()
+        with open(caminho, "w", newline="") as arquivo:
+            escritor = csv.writer(arquivo)
+            escritor.writerow(trace.keys())
+            escritor.writerows(zip(*(valores.tolist() for valores in trace.values())))
+
+    def imprimir(self):
+        trace = self.trace()
+        for k, x, fx, a, b in zip(*trace.values()):
+            linha = f"Iteração {k}: x{k} = {x}"
+            if not cmath.isnan(fx):
+                linha += f", f(x{k}) = {fx}"
+            if not math.isnan(a):
+                linha += f", a{k} = {a}, b{k} = {b}"
+            print(linha)
+        print(f"Iterações: {self.iteracoes}, avaliações de f: {self.avaliacoes}, tempo: {self.tempo:.6f} s")
+        for nome, valor in self.contadores.items():
+            print(f"{nome}: {valor}")
+
+
+if __name__ == "__main__":
+    # Exemplo: raíz de x**2 - 2 por bissecção, com buffer de só 5 registros
+    def f(x):
+        return x**2 - 2
+
+    tel = Telemetria(capacidade=5)
+    f_contada = tel.contar(f)
+    with tel:
+        a, b = 1.0, 2.0
+        for k in range(1, 21):
+            x = (a + b) / 2
+            fx = f_contada(x)
+            if fx < 0:
+                a = x
+            else:
+                b = x
+            tel.registrar(k, x, fx, a, b)
+
+    tel.imprimir()
+    print(tel.exportar()["descartados"], "registros descartados")
@@ -1,6 +1,8 @@
 import numpy as np
 import matplotlib.pyplot as plt
 
+from lagrange_baricentrico import LagrangeBaricentrico
+
 def Lagrange(x, x_tab, y_tab):
     """
     Calcula o valor do polinômio interpolador de Lagrange em um ponto x
@@ -18,7 +20,6 @@ def Lagrange(x, x_tab, y_tab):
     
     for i in range(n):
         l = np.ones_like(x)  # Inicializa o polinômio base L_k(x)
-        print(l)
         
         for j in range(n):
             if i != j:  
@@ -39,7 +40,10 @@ y_tab = np.array([4., 1., -1.])  # Valores y correspondentes --> y0, y1, y2
 
 # Criar pontos para plotagem suave
 x_plot = np.linspace(min(x_tab)-0.5, max(x_tab)+0.5, 1000)
-y_plot = Lagrange(x_plot, x_tab, y_tab)
+
+# Forma baricêntrica: pesos calculados uma vez, avaliação em O(n) por ponto
+p = LagrangeBaricentrico(x_tab, y_tab)
+y_plot = p(x_plot)
 
 # Plotar o gráfico
 plt.figure(figsize=(10, 6))
@@ -2,29 +2,29 @@ import numpy as np
 import matplotlib.pyplot as plt
 
 def eliminacao(A, b):
+    # b pode ser um vetor ou uma matriz n x k (uma coluna por sistema)
     A = A.astype(float)
     b = b.astype(float)
     n = len(A)
 
     # Eliminação para transformar a matriz em triangular superior
     for k in range(n):
-        for i in range(k+1, n):
-            if A[k, k] == 0:
-                raise ValueError("Matriz singular, não é possível continuar.")
-            m = A[i, k] / A[k, k]
-            for j in range(k, n):
-                A[i, j] -= m * A[k, j]
-            b[i] -= m * b[k]
+        if A[k, k] == 0:
+            raise ValueError("Matriz singular, não é possível continuar.")
+        # Multiplicadores de todas as linhas abaixo do pivô de uma vez
+        m = A[k+1:, k] / A[k, k]
+        A[k+1:, k:] -= np.outer(m, A[k, k:])
+        b[k+1:] -= np.multiply.outer(m, b[k])
     
     return A, b
 
 def resolucao_sistema(A, b):
     n = len(A)
-    x = np.zeros(n)
+    x = np.zeros_like(b, dtype=float)
     
     x[n-1] = b[n-1] / A[n-1, n-1]
     for k in range(n-2, -1, -1):
-        s = sum(A[k, j] * x[j] for j in range(k+1, n))
+        s = A[k, k+1:] @ x[k+1:]
         x[k] = (b[k] - s) / A[k, k]
     
     return x
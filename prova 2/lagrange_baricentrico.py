@@ -0,0 +1,89 @@
+import numpy as np
+
+class LagrangeBaricentrico:
+    """
+    Polinômio interpolador de Lagrange na forma baricêntrica:
+
+        p(x) = Σ w_i y_i / (x - x_i)  /  Σ w_i / (x - x_i),   w_i = 1 / Π_{j≠i} (x_i - x_j)
+
+    Os pesos w_i são calculados uma vez (O(n²)); cada avaliação custa O(n) por ponto,
+    e um novo nó é acrescentado em O(n) sem recalcular os demais pesos.
+
+    Parâmetros:
+    x_tab -- pontos x de interpolação (distintos)
+    y_tab -- valores y correspondentes
+    """
+
+    def __init__(self, x_tab, y_tab):
+        self.x_tab = np.zeros(0)
+        self.y_tab = np.zeros(0)
+        self.pesos = np.zeros(0)
+        # Os pesos são acumulados como log|w_i| e sinal: o produto das diferenças
+        # sairia do intervalo do float com muitos nós ou nós muito espaçados
+        self._log_pesos = np.zeros(0)
+        self._sinais = np.zeros(0)
+        for x_i, y_i in zip(x_tab, y_tab):
+            self.adicionar_no(x_i, y_i)
+
+    def adicionar_no(self, x_novo, y_novo):
+        """
+        Acrescenta o nó (x_novo, y_novo) atualizando os pesos em O(n).
+        """
+        d = self.x_tab - x_novo
+        if np.any(d == 0):
+            raise ValueError("Os pontos x de interpolação devem ser distintos.")
+
+        log_d = np.log(np.abs(d))
+        self._log_pesos = np.append(self._log_pesos - log_d, -np.sum(log_d))
+        self._sinais = np.append(self._sinais * np.sign(d), np.prod(np.sign(-d)))
+
+        # A fórmula não muda se todos os pesos forem multiplicados pela mesma constante:
+        # o maior peso passa a valer 1
+        self.pesos = self._sinais * np.exp(self._log_pesos - np.max(self._log_pesos))
+        self.x_tab = np.append(self.x_tab, float(x_novo))
+        self.y_tab = np.append(self.y_tab, float(y_novo))
+
+    def __call__(self, x, bloco=2**20):
+        """
+        Avalia o polinômio em x (escalar ou array) em O(n·m), vetorizado.
+        Os pontos são processados em blocos de modo que cada matriz intermediária
+        tenha cerca de "bloco" elementos.
+        """
+        x = np.asarray(x, dtype=float)
+        pontos = x.ravel()
+        resultado = np.empty(len(pontos))
+        passo = max(bloco // max(len(self.x_tab), 1), 1)
+
+        for inicio in range(0, len(pontos), passo):
+            t = pontos[inicio:inicio + passo]
+            d = t[:, None] - self.x_tab[None, :]
+
+            # Pontos que coincidem com um nó recebem o valor tabelado
+            linha, coluna = np.nonzero(d == 0)
+            d[linha] = 1.0
+            c = self.pesos / d
+            c[linha] = 0.0
+            c[linha, coluna] = 1.0
+
+            # p(x) = y_0 + Σ c_i (y_i - y_0) / Σ c_i: com y constante o numerador é
+            # exatamente zero, e a constante é reproduzida sem erro de arredondamento
+            y0 = self.y_tab[0]
+            resultado[inicio:inicio + passo] = y0 + (c @ (self.y_tab - y0)) / c.sum(axis=1)
+
+        return resultado.reshape(x.shape)
+
+if __name__ == "__main__":
+    # Exemplo de uso
+    p = LagrangeBaricentrico([-1., 0., 2.], [4., 1., -1.])
+    print(p([-1., 0., 1., 2.]))
+
+    # Acrescentando um nó: agora interpola também (1, 0)
+    p.adicionar_no(1., 0.)
+    print(p([-1., 0., 1., 2.]))
+
+    # Nós de Chebyshev e uma grade de um milhão de pontos
+    n = 200
+    x_tab = np.cos(np.pi * (2*np.arange(n) + 1) / (2*n))
+    p = LagrangeBaricentrico(x_tab, 1 / (1 + 25 * x_tab**2))
+    x = np.linspace(-1, 1, 1_000_000)
+    print("Erro máximo (Runge):", np.max(np.abs(p(x) - 1 / (1 + 25 * x**2))))